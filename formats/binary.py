@@ -75,6 +75,10 @@ class _BaseBinaryWrapper:
         self.stream.seek(pos)
         return ret
 
+    def getbuffer(self) -> memoryview:
+        # Only available for in-memory streams, gives a view of the data without copying it
+        return self.stream.getbuffer()
+
     def align(self, alignment=4):
         if offset := (self.tell() % alignment):
             self.seek(self.tell() + alignment - offset)
@@ -1,7 +1,6 @@
 import logging
 from typing import *
-import ndspy.lz10 as lz10
-from formats.compression import rle, huffman
+from formats.compression import lz10, rle, huffman
 import struct
 
 # Compression containers
@@ -189,7 +189,6 @@ def compress(input_data: bytes, datablock_size=None) -> bytes:
 
 def decompress(data: bytes) -> bytes:
     rdr = BinaryReader(data)
-    wtr = BinaryWriter()
     compression_type = rdr.read_uint8()
     if compression_type == 0x24:
         blocksize = 4
@@ -214,6 +213,7 @@ def decompress(data: bytes) -> bytes:
 
     cashedbyte = -1
 
+    out = bytearray()
     while current_size < ds:
         # Find next reference to commands node
         while not current_node.is_data:
@@ -230,16 +230,16 @@ def decompress(data: bytes) -> bytes:
 
         if blocksize == 8:
             current_size += 1
-            wtr.write_uint8(current_node.data)
+            out.append(current_node.data)
 
         elif blocksize == 4:
             if cashedbyte < 0:
                 cashedbyte = current_node.data
             else:
                 cashedbyte |= current_node.data << 4
-                wtr.write_uint8(cashedbyte)
+                out.append(cashedbyte)
                 current_size += 1
                 cashedbyte = -1
         current_node = root_node
 
-    return wtr.data
+    return bytes(out)
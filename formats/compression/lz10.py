@@ -0,0 +1,111 @@
+import struct
+from typing import Tuple
+
+import numpy as np
+import ndspy.lz10
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional, without it the pure Python decoder is used
+    njit = None
+
+
+def compress(data: bytes) -> bytes:
+    # ndspy already does the match search with bytes.find, which runs in C.
+    return ndspy.lz10.compress(bytes(data))
+
+
+def _corrupt_data_error(offset: int) -> ValueError:
+    return ValueError(f"LZ10 data is truncated or corrupt at offset {offset:#x}")
+
+
+def _decompress_py(data: bytes, size: int) -> bytes:
+    out = bytearray()
+    in_pos = 4
+    data_end = len(data)
+    while len(out) < size and in_pos < data_end:
+        flags = data[in_pos]
+        in_pos += 1
+        if not flags:
+            # Eight literal bytes in a row
+            out += data[in_pos:in_pos + 8]
+            in_pos += 8
+            continue
+        for _ in range(8):
+            if in_pos >= data_end:
+                break
+            if flags & 0x80:
+                if in_pos + 2 > data_end:
+                    raise _corrupt_data_error(in_pos)
+                token, = struct.unpack_from(">H", data, in_pos)
+                in_pos += 2
+                length = (token >> 12) + 3
+                distance = (token & 0xFFF) + 1
+                window = len(out) - distance
+                if window < 0:
+                    # The copy starts before the output
+                    raise _corrupt_data_error(in_pos - 2)
+                if distance >= length:
+                    out += out[window:window + length]
+                else:
+                    # The copy overlaps itself, so it repeats the last distance bytes.
+                    out += (out[window:] * (length // distance + 1))[:length]
+            else:
+                out += data[in_pos:in_pos + 1]
+                in_pos += 1
+            if len(out) >= size:
+                break
+            flags <<= 1
+    if len(out) < size:
+        raise _corrupt_data_error(min(in_pos, data_end))
+    return bytes(out[:size])
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _decompress_jit(data: np.ndarray, size: int) -> Tuple[np.ndarray, int]:
+        # Returns the decompressed data and -1, or the offset of the corrupt data, as numba can't format the error.
+        out = np.empty(size, dtype=np.uint8)
+        in_pos = 4
+        out_pos = 0
+        data_end = len(data)
+        while out_pos < size and in_pos < data_end:
+            flags = np.int64(data[in_pos])
+            in_pos += 1
+            for _ in range(8):
+                if out_pos >= size or in_pos >= data_end:
+                    break
+                if flags & 0x80:
+                    if in_pos + 2 > data_end:
+                        return out, in_pos
+                    token = (np.int64(data[in_pos]) << 8) | data[in_pos + 1]
+                    in_pos += 2
+                    length = (token >> 12) + 3
+                    window = out_pos - (token & 0xFFF) - 1
+                    if window < 0:
+                        return out, in_pos - 2
+                    for _ in range(min(length, size - out_pos)):
+                        out[out_pos] = out[window]
+                        out_pos += 1
+                        window += 1
+                else:
+                    out[out_pos] = data[in_pos]
+                    out_pos += 1
+                    in_pos += 1
+                flags <<= 1
+        if out_pos < size:
+            return out, min(in_pos, data_end)
+        return out, -1
+
+
+def decompress(data: bytes) -> bytes:
+    if data[0] != 0x10:
+        raise TypeError("This isn't a LZ10-compressed file.")
+    size = struct.unpack_from("<I", data)[0] >> 8
+    if njit is not None:
+        out, error_offset = _decompress_jit(np.frombuffer(data, dtype=np.uint8), size)
+        if error_offset >= 0:
+            raise _corrupt_data_error(error_offset)
+        return out.tobytes()
+    return _decompress_py(data, size)
@@ -68,7 +68,6 @@ def compress(data: bytes):
 
 def decompress(data: bytes):
     rdr = BinaryReader(data)
-    wtr = BinaryWriter()
     type_ = rdr.read_uint8()
     if type_ != 0x30:
         raise Exception("Tried to decompress commands that isn't RLE")
@@ -76,6 +75,8 @@ def decompress(data: bytes):
     if ds == 0:
         rdr.read_uint32()
 
+    # Build the output in a single bytearray rather than writing byte by byte.
+    out = bytearray()
     while True:
         flag = rdr.read_uint8()
         if flag is None:
@@ -84,10 +85,8 @@ def decompress(data: bytes):
         length = flag & 0x7f
         length += 3 if compressed else 1
         if compressed:
-            next_ = rdr.read_uint8()
-            for i in range(length):
-                wtr.write_uint8(next_)
+            out += rdr.read(1) * length
         else:
-            wtr.write(rdr.read(length))
+            out += rdr.read(length)
 
-    return wtr.data
+    return bytes(out)
@@ -1,6 +1,7 @@
 import io
 import os
-import re
+import struct
+from bisect import bisect_left
 
 import ndspy.rom
 from ndspy.fnt import *
@@ -9,6 +10,22 @@ from formats.binary import *
 from .compression import *
 
 
+# Valid file modes mapped to (operation, text, create).
+_MODE_MAP = {
+    "r": ("r", True, False), "rb": ("r", False, False), "r+": ("r", True, True), "rb+": ("r", False, True),
+    "w": ("w", True, False), "wb": ("w", False, False), "w+": ("w", True, True), "wb+": ("w", False, True),
+    "a": ("a", True, False), "ab": ("a", False, False), "a+": ("a", True, True), "ab+": ("a", False, True),
+}
+
+
+def _parse_mode(mode: str) -> Tuple[str, bool, bool]:
+    """Returns the operation ('r', 'w' or 'a'), whether the file is opened as text and whether it should be created."""
+    try:
+        return _MODE_MAP[mode]
+    except KeyError:
+        raise ValueError(f"invalid mode: '{mode}'") from None
+
+
 class Archive:
     """
     Abstract interface representing a file archive.
@@ -16,11 +33,18 @@ class Archive:
     files: List[bytes] = []
     """List of the data contained in the files."""
     opened_files: list = []
-    """List of the currently opened files."""
+    """List of the currently opened files which can write to the archive."""
 
     def open(self, file: Union[AnyStr, int], mode: str = "rb") -> Union[io.BytesIO, io.TextIOWrapper]:
         pass
 
+    def flush_opened_files(self):
+        """
+        Writes the data of all the files still opened for writing back to the archive.
+        """
+        for fp in self.opened_files:
+            fp.flush()
+
     def add_file(self, file: str) -> Optional[int]:
         """
         Adds a file at the specified path.
@@ -72,7 +96,9 @@ class RomFile(io.BytesIO):
         self.archive = archive
         self.id = index
         self.opp = operation
-        if self not in self.archive.opened_files:
+        self._dirty = operation == "w"  # opening for writing truncates the file
+        # Only files which can write back need to be tracked, read only files are left to the garbage collector.
+        if operation != "r" and self not in self.archive.opened_files:
             self.archive.opened_files.append(self)
         super().__init__(self.archive.files[index] if operation in ["r", "a"] else b"")
         if operation == "a":
@@ -81,6 +107,18 @@ class RomFile(io.BytesIO):
     def writable(self) -> bool:
         return self.opp in ["w", "a"]
 
+    def write(self, b) -> int:
+        self._dirty = True
+        return super().write(b)
+
+    def writelines(self, lines) -> None:
+        self._dirty = True
+        super().writelines(lines)
+
+    def truncate(self, size: Optional[int] = None) -> int:
+        self._dirty = True
+        return super().truncate(size)
+
     def close(self):
         self.flush()
         super().close()
@@ -92,8 +130,10 @@ class RomFile(io.BytesIO):
 
     def flush(self):
         if not self.closed:
-            if self.opp != "r":
+            # Only copy the data back to the archive if it changed since the last flush.
+            if self.opp != "r" and self._dirty:
                 self.archive.files[self.id] = self.getvalue()
+                self._dirty = False
             super().flush()
 
     def __enter__(self):
@@ -104,9 +144,6 @@ class RomFile(io.BytesIO):
         self.close()
         super().__exit__(*args)
 
-    def __del__(self):
-        self.close()
-
 
 class CompressedIOWrapper(io.BytesIO):
     """
@@ -122,21 +159,37 @@ class CompressedIOWrapper(io.BytesIO):
             Whether the file has its compression type specified twice.
         """
         self._stream = stream
+        self._dirty = False
 
         current, self.double_typed = decompress(stream.read(), double_typed)
 
         super().__init__(current)
 
+    def write(self, b) -> int:
+        self._dirty = True
+        return super().write(b)
+
+    def writelines(self, lines) -> None:
+        self._dirty = True
+        super().writelines(lines)
+
+    def truncate(self, size: Optional[int] = None) -> int:
+        self._dirty = True
+        return super().truncate(size)
+
     def close(self):
         self.flush()
         super().close()
         self._stream.close()
 
     def flush(self):
-        if self._stream.writable():
-            self._stream.truncate(0)
+        # Compressing is slow, only do it if the data changed since the last flush.
+        if self._dirty and self._stream.writable():
+            # Overwrite in place and cut off the leftovers, so the stream is not emptied and regrown.
             self._stream.seek(0)
-            self._stream.write(compress(self.getvalue(), double_typed=self.double_typed))
+            size = self._stream.write(compress(self.getvalue(), double_typed=self.double_typed))
+            self._stream.truncate(size)
+            self._dirty = False
         super().flush()
         self._stream.flush()
 
@@ -152,12 +205,19 @@ class NintendoDSRom(ndspy.rom.NintendoDSRom, Archive):
     opened_files: List[RomFile]
     _loaded_archives: dict
 
+    INSERT_BATCH_SIZE = 256
+    """Number of files above which adding or removing files rebuilds the file list instead of shifting it per file."""
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._opened_files = []
-        """List of currently opened files."""
+        self.opened_files = []
+        """List of currently opened files which can write to the ROM."""
         self._loaded_archives: Dict[str, PlzArchive] = {}
         """List of currently loaded archives."""
+        self._name_id_cache: Dict[str, int] = {}
+        """Cache of file ids by path, cleared when the file structure changes."""
+        self._id_name_cache: Dict[int, str] = {}
+        """Cache of file paths by id, cleared when the file structure changes."""
 
         self._get_archive_call = False
 
@@ -187,6 +247,7 @@ class NintendoDSRom(ndspy.rom.NintendoDSRom, Archive):
         for arch in self._loaded_archives:
             self._loaded_archives[arch].save()
         self._get_archive_call = False
+        self.flush_opened_files()
         return super(NintendoDSRom, self).save(*args, **kwargs)
 
     # TODO: Unify archive opening and make sure archive are opened only once
@@ -207,22 +268,19 @@ class NintendoDSRom(ndspy.rom.NintendoDSRom, Archive):
             The opened rom file.
         """
 
-        match = re.findall(r"^([rwa])(b?)(\+?)$", mode)
-        if not match:
-            raise ValueError(f"invalid mode: '{mode}'")
-        create = False
-        text = True
-        if match:
-            if match[0][1] == "b":
-                text = False
-            if match[0][2] == "+":
-                create = True
+        operation, text, create = _parse_mode(mode)
 
         if isinstance(file, int):
             fileid = file
-            file = self.filenames.filenameOf(file)
+            file = self._id_name_cache.get(fileid)
+            if file is None:
+                file = self._id_name_cache[fileid] = self.filenames.filenameOf(fileid)
         else:
-            fileid = self.filenames.idOf(file)
+            fileid = self._name_id_cache.get(file)
+            if fileid is None:
+                fileid = self.filenames.idOf(file)
+                if fileid is not None:
+                    self._name_id_cache[file] = fileid
             if not fileid and create:
                 fileid = self.add_file(file)
                 if not fileid:
@@ -234,65 +292,155 @@ class NintendoDSRom(ndspy.rom.NintendoDSRom, Archive):
             # Alert on the log of this action.
             logging.warning("PLZ archive not opened from get_archive!", stack_info=True)
 
-        rom_file = RomFile(self, fileid, match[0][0])
+        rom_file = RomFile(self, fileid, operation)
         if text:
             return io.TextIOWrapper(rom_file)
         return rom_file
 
     def add_file(self, file: str) -> Optional[int]:
+        self._clear_filename_caches()
+
         folder_name, filename = os.path.split(file)
         folder_add = self.filenames[folder_name]
         new_file_id = folder_add.firstID + len(folder_add.files)
 
-        # Insert our new file into this ID
+        # Insert our new file into its ID
         self.files.insert(new_file_id, b"")
-
-        # Add our file to the folder
         folder_add.files.append(filename)
 
-        # Change the firstID of all the folders after our base folder.
-        def increment_first_index_if_needed(new_id, root: Folder):
-            if root.firstID >= new_id and root != folder_add:
+        # Change the firstID of all the folders after the new file.
+        stack = [self.filenames]
+        while stack:
+            root = stack.pop()
+            if root.firstID >= new_file_id and root is not folder_add:
                 root.firstID += 1
+            for _, folder in root.folders:
+                stack.append(folder)
 
-            for fd in root.folders:
-                increment_first_index_if_needed(new_id, fd[1])
+        # increment the id of loaded files after the new file
+        for fp in self.opened_files:
+            if fp.id >= new_file_id:
+                fp.id += 1
 
-        increment_first_index_if_needed(new_file_id, self.filenames)
+        return new_file_id
 
-        # increment the id of loaded files after our base id
-        for fp in self._opened_files:
-            if fp.id > new_file_id:
-                fp.id += 1
+    def add_files(self, files: List[str]) -> List[int]:
+        """
+        Adds multiple files at once, walking the folder tree a single time.
 
-            if fp.id == new_file_id:
-                fp.close()
+        Parameters
+        ----------
+        files : List[str]
+            The paths where the files should be created.
 
-        return new_file_id
+        Returns
+        -------
+        List[int]
+            The ids of the created files, in the same order as the paths.
+        """
+        self._clear_filename_caches()
+
+        # Group the new files by the folder they are added to, keeping the order they were given in.
+        targets: Dict[Folder, List[int]] = {}
+        for i, file in enumerate(files):
+            folder_name, filename = os.path.split(file)
+            folder_add = self.filenames[folder_name]
+            targets.setdefault(folder_add, []).append(i)
+            folder_add.files.append(filename)
+
+        # Every new file is inserted at the end of its folder. The sort keys place the new files of a
+        # non-empty folder before those of empty folders starting at the same id, and empty folders
+        # between them in the order they were added to.
+        insert_keys = []
+        folder_keys = {}
+        for rank, (folder_add, indices) in enumerate(targets.items()):
+            end_id = folder_add.firstID + len(folder_add.files) - len(indices)
+            key = (end_id, 1 if end_id == folder_add.firstID else 0, rank)
+            folder_keys[folder_add] = key
+            insert_keys.extend([key] * len(indices))
+        insert_keys.sort()
+
+        new_ids = [0] * len(files)
+        for folder_add, indices in targets.items():
+            key = folder_keys[folder_add]
+            new_file_id = key[0] + bisect_left(insert_keys, key)
+            for i in indices:
+                new_ids[i] = new_file_id
+                new_file_id += 1
+
+        # Insert our new files into their IDs, in ascending order so each lands on its final ID.
+        if len(new_ids) <= self.INSERT_BATCH_SIZE:
+            for new_file_id in sorted(new_ids):
+                self.files.insert(new_file_id, b"")
+        else:
+            # Rebuilding the list once is cheaper than shifting it for every file of a big batch.
+            new_ids_set = set(new_ids)
+            old_files = iter(self.files)
+            self.files[:] = [b"" if i in new_ids_set else next(old_files)
+                             for i in range(len(self.files) + len(files))]
+
+        # Change the firstID of all the folders after the new files.
+        stack = [self.filenames]
+        while stack:
+            root = stack.pop()
+            key = folder_keys.get(root)
+            if key is None or key[1] == 0:
+                key = (root.firstID, 2)
+            root.firstID += bisect_left(insert_keys, key)
+            for _, folder in root.folders:
+                stack.append(folder)
+
+        # increment the id of loaded files after the new files
+        for fp in self.opened_files:
+            fp.id += bisect_left(insert_keys, (fp.id, 2))
+
+        return new_ids
 
     def remove_file(self, file: str):
-        folder_name, filename = os.path.split(file)
-        folder: Folder = self.filenames[folder_name]
-        fileid = self.filenames.idOf(file)
-        folder.files.remove(filename)
-        del self.files[fileid]
+        self.remove_files([file])
+
+    def remove_files(self, files: List[str]):
+        """
+        Removes multiple files at once, walking the folder tree a single time.
 
-        def decrement_first_index_if_needed(removed_id, root: Folder):
-            if root.firstID > removed_id:
-                root.firstID -= 1
+        Parameters
+        ----------
+        files : List[str]
+            Paths of the files which should be removed.
+        """
+        self._clear_filename_caches()
+
+        # Get all the ids before removing any name, as that shifts the ids of the files after it.
+        removed_ids = sorted(self.filenames.idOf(file) for file in files)
+        for file in files:
+            folder_name, filename = os.path.split(file)
+            folder: Folder = self.filenames[folder_name]
+            folder.files.remove(filename)
+
+        removed_ids_set = set(removed_ids)
+        for fp in list(self.opened_files):  # closing removes the file from the list
+            if fp.id in removed_ids_set:
+                fp.close()
 
-            for fd in root.folders:
-                decrement_first_index_if_needed(removed_id, fd[1])
+        if len(removed_ids) <= self.INSERT_BATCH_SIZE:
+            # Deleting from the end keeps the ids still to be deleted valid.
+            for removed_id in reversed(removed_ids):
+                del self.files[removed_id]
+        else:
+            self.files[:] = [data for i, data in enumerate(self.files) if i not in removed_ids_set]
 
-        decrement_first_index_if_needed(fileid, self.filenames)
-        for fp in self._opened_files:
-            if fp.id > fileid:
-                fp.id -= 1
+        stack = [self.filenames]
+        while stack:
+            root = stack.pop()
+            root.firstID -= bisect_left(removed_ids, root.firstID)
+            for _, folder in root.folders:
+                stack.append(folder)
 
-            if fp.id == fileid:
-                fp.close()
+        for fp in self.opened_files:
+            fp.id -= bisect_left(removed_ids, fp.id)
 
     def rename_file(self, path: str, new_filename: str):
+        self._clear_filename_caches()
         folder_name, filename = os.path.split(path)
         folder: Folder = self.filenames[folder_name]
         index = folder.files.index(filename)
@@ -318,6 +466,10 @@ class NintendoDSRom(ndspy.rom.NintendoDSRom, Archive):
         with self.open(new_path, "wb+") as f:
             f.write(data)
 
+    def _clear_filename_caches(self):
+        self._name_id_cache.clear()
+        self._id_name_cache.clear()
+
     # TODO: Docstrings for folder methods.
 
     @staticmethod
@@ -325,39 +477,43 @@ class NintendoDSRom(ndspy.rom.NintendoDSRom, Archive):
         return [x for x in path.split("/") if x]
 
     def folder_get_parent(self, path) -> Folder:
+        return self.folder_get_parent_and_name(path)[0]
+
+    def folder_get_parent_and_name(self, path) -> Tuple[Folder, str]:
         *basedirs, subdir = self.folder_split(path)
         if basedirs:
             base_path = "/".join(basedirs) + "/"
-            return self.filenames[base_path]
+            return self.filenames[base_path], subdir
         else:  # The folder is located at the root.
-            return self.filenames
+            return self.filenames, subdir
 
     def add_folder(self, path):
-        parent = self.folder_get_parent(path)
+        self._clear_filename_caches()
+        parent, name = self.folder_get_parent_and_name(path)
         new_folder = Folder(firstID=len(self.files))
-        parent.folders.append((self.folder_split(path)[-1], new_folder))
+        parent.folders.append((name, new_folder))
 
     def remove_folder(self, path):
+        self._clear_filename_caches()
         folder = self.filenames[path]
         if not folder:
             raise Exception(f"Directory {path} does not exist.")
         if folder.files or folder.folders:
             raise Exception(f"Directory {path} not empty.")
 
-        parent = self.folder_get_parent(path)
+        parent, name = self.folder_get_parent_and_name(path)
 
-        parent.folders.remove((self.folder_split(path)[-1], folder))
+        parent.folders.remove((name, folder))
 
     def rename_folder(self, old_path, new_path):
+        self._clear_filename_caches()
         folder = self.filenames[old_path]
 
-        # get parents
-        old_parent = self.folder_get_parent(old_path)
-        new_parent = self.folder_get_parent(new_path)
-
-        # generate folder items.
-        old_folder_item = (self.folder_split(old_path)[-1], folder)
-        new_folder_item = (self.folder_split(new_path)[-1], folder)
+        # get parents and generate folder items.
+        old_parent, old_name = self.folder_get_parent_and_name(old_path)
+        new_parent, new_name = self.folder_get_parent_and_name(new_path)
+        old_folder_item = (old_name, folder)
+        new_folder_item = (new_name, folder)
 
         if old_parent != new_parent:
             old_parent.folders.remove(old_folder_item)
@@ -423,7 +579,7 @@ class FileFormat:
                 if self._last_rom:
                     file = self._last_rom.open(self._last_filename, "wb+")
                 else:
-                    open(self._last_filename, "wb+")
+                    file = open(self._last_filename, "wb+")
 
         if compressed is None:
             compressed = self._last_compressed
@@ -451,10 +607,24 @@ class PlzArchive(Archive, FileFormat):
     """
     _compressed_default = 1
 
-    filenames: List[str] = []
+    filenames: List[str]
     """List of the names of the files present in the plz archive."""
-    files: List[bytes] = []
-    """List of the data of the files present in the plz archive."""
+    files: List[Union[bytes, memoryview]]
+    """
+    List of the data of the files present in the plz archive.
+
+    Files read from the archive are views into the decompressed archive data, so they are only copied when opened.
+    """
+    opened_files: List[RomFile]
+    _name_to_id: Dict[str, int]
+    """Index of each filename in the filenames list."""
+
+    def __init__(self, filename: str = None, file=None, compressed=None, rom: NintendoDSRom = None, **kwargs):
+        self.filenames = []
+        self.files = []
+        self.opened_files = []
+        self._name_to_id = {}
+        super(PlzArchive, self).__init__(filename=filename, file=file, compressed=compressed, rom=rom, **kwargs)
 
     def read_stream(self, stream):
         if isinstance(stream, BinaryReader):
@@ -464,90 +634,72 @@ class PlzArchive(Archive, FileFormat):
 
         self.filenames = []
         self.files = []
+        self._name_to_id = {}
+        self.opened_files = []
 
-        header_size = rdr.read_uint32()
-        archive_file_size = rdr.read_uint32()
-        assert rdr.read(4) == b"PCK2"
-        rdr.seek(header_size)
+        # Parse the archive straight from its bytes instead of issuing a read per field.
+        data = rdr.readall()
+        header_size, archive_file_size, magic = struct.unpack_from("<II4s", data, 0)
+        assert magic == b"PCK2"
+        view = memoryview(data)
 
-        while rdr.c < archive_file_size:
-            start_pos = rdr.c
+        pos = header_size
+        while pos < archive_file_size:
+            file_header_size, file_total_size, _, file_size = struct.unpack_from("<IIII", data, pos)
 
-            file_header_size = rdr.read_uint32()
-            file_total_size = rdr.read_uint32()
-            rdr.seek(4, io.SEEK_CUR)
-            file_size = rdr.read_uint32()
+            filename = data[pos + 16:data.index(b"\0", pos + 16)]
+            # Most filenames are plain ASCII, which avoids going through the shift-jis codec.
+            filename = filename.decode("ascii") if filename.isascii() else filename.decode("shift-jis")
 
-            filename = rdr.read_string(encoding="shift-jis")
-
-            rdr.seek(start_pos + file_header_size)
-            file = rdr.read(file_size)
-            rdr.seek(start_pos + file_total_size)
+            file_start = pos + file_header_size
+            file = view[file_start:file_start + file_size]
+            pos += file_total_size
 
+            self._name_to_id.setdefault(filename, len(self.filenames))
             self.filenames.append(filename)
             self.files.append(file)
 
     def write_stream(self, stream):
-        if isinstance(stream, BinaryWriter):
-            wtr = stream
-        else:
-            wtr = BinaryWriter(stream)
-
-        wtr.write_uint32(16)
-        wtr.write_uint32(0)  # placeholder file_size
-        wtr.write(b"PCK2")
-        wtr.write_uint32(0)
-
-        for i in range(len(self.files)):
-            header_size = 16 + len(self.filenames[i]) + 1
+        self.flush_opened_files()
+
+        # Compute the layout first, so the whole archive can be built in one buffer and written at once.
+        entries = []
+        file_size = 16
+        for filename, file in zip(self.filenames, self.files):
+            filename = filename.encode("ascii") if filename.isascii() else filename.encode("shift-jis")
+            header_size = 16 + len(filename) + 1
             header_size += 4 - header_size % 4
 
-            total_size = header_size + len(self.files[i])
+            total_size = header_size + len(file)
             total_size += 4 - total_size % 4
-            c = wtr.c
-            wtr.write_uint32(header_size)
-            wtr.write_uint32(total_size)
-            wtr.write_uint32(0)
-            wtr.write_uint32(len(self.files[i]))
-
-            wtr.write_string(self.filenames[i])
-            wtr.seek(c + header_size)
-            wtr.write(self.files[i])
-            # Seek while adding bytes
-            while wtr.c != c + total_size:
-                wtr.write_uint8(0)
-
-        file_size = len(wtr)
-        wtr.seek(4)
-        wtr.write_uint32(file_size)
+            entries.append((filename, file, header_size, total_size))
+            file_size += total_size
+
+        data = bytearray(file_size)
+        struct.pack_into("<II4sI", data, 0, 16, file_size, b"PCK2", 0)
+
+        c = 16
+        for filename, file, header_size, total_size in entries:
+            struct.pack_into("<IIII", data, c, header_size, total_size, 0, len(file))
+            data[c + 16:c + 16 + len(filename)] = filename
+            data[c + header_size:c + header_size + len(file)] = file
+            c += total_size
+
+        stream.write(data)
 
     def open(self, file: Union[AnyStr, int], mode: str = "rb") -> Union[io.BytesIO, io.TextIOWrapper]:
-        match = re.findall(r"^([rwa])(b?)(\+?)$", mode)
-        if not match:
-            raise ValueError(f"invalid mode: '{mode}'")
-        create = False
-        text = True
-        if match:
-            if match[0][1] == "b":
-                text = False
-            if match[0][2] == "+":
-                create = True
+        operation, text, create = _parse_mode(mode)
 
         if isinstance(file, int):
             fileid = file
         else:
-            try:
-                fileid = self.filenames.index(file)
-            except ValueError:
-                fileid = None
+            fileid = self._name_to_id.get(file)
             if fileid is None and create:
                 fileid = self.add_file(file)
-                if not fileid:
-                    raise FileNotFoundError(f"file '{file}' could not be opened nor created")
             if fileid is None:
                 raise FileNotFoundError(f"file '{file}' could not be opened")
 
-        rom_file = RomFile(self, fileid, match[0][0])
+        rom_file = RomFile(self, fileid, operation)
         if text:
             return io.TextIOWrapper(rom_file)
         return rom_file
@@ -556,18 +708,29 @@ class PlzArchive(Archive, FileFormat):
         new_file_id = len(self.files)
         self.files.append(b"")
         self.filenames.append(filename)
+        # Names are looked up to their first file, like filenames.index, so a duplicate keeps the earlier id.
+        self._name_to_id.setdefault(filename, new_file_id)
 
         return new_file_id
 
     def remove_file(self, filename: str):
-        if filename not in self.filenames:
+        index = self._name_to_id.pop(filename, None)
+        if index is None:
             return
-        index = self.filenames.index(filename)
         self.files.pop(index)
         self.filenames.pop(index)
+        # Only the files after the removed one change index, and only the first file of each name is indexed.
+        for i in range(index, len(self.filenames)):
+            name = self.filenames[i]
+            if self._name_to_id.get(name, i + 1) == i + 1:
+                self._name_to_id[name] = i
 
     def rename_file(self, old_filename, new_filename):
-        if old_filename not in self.filenames:
+        index = self._name_to_id.pop(old_filename, None)
+        if index is None:
             return
-        index = self.filenames.index(old_filename)
         self.filenames[index] = new_filename
+        if old_filename in self.filenames:
+            self._name_to_id[old_filename] = self.filenames.index(old_filename, index)
+        if self._name_to_id.get(new_filename, index) >= index:
+            self._name_to_id[new_filename] = index
@@ -2,7 +2,7 @@ import logging
 
 from formats import binary
 import io
-from queue import PriorityQueue
+import heapq
 from dataclasses import dataclass, field
 from typing import Any
 from formats.sound.smdl import smdl
@@ -34,7 +34,8 @@ class SMDLSequencer:
         self.track_lengths = []
         self.track_completed = [False] * len(self.smd_obj.tracks)
 
-        self.event_queue = PriorityQueue()
+        # Heap of PrioritizedItem, only used from the thread generating the samples
+        self.event_queue = []
         self.current_tick = 0
         self.completed = False
 
@@ -156,7 +157,7 @@ class SMDLSequencer:
                         logging.debug(f"{prefix_}Note off {midi_note}")
 
                 queue_stop_object = PrioritizedItem(note_end, on_note_end)
-                self.event_queue.put(queue_stop_object)
+                heapq.heappush(self.event_queue, queue_stop_object)
             elif 0x80 <= event <= 0x8F:  # Pause
                 pause_time = self.PAUSE_TICKS[event - 0x80]  # ticks
                 self.last_delay[track_id] = pause_time
@@ -168,7 +169,7 @@ class SMDLSequencer:
                     logging.debug(f"{prefix}Pause 1 ending on {pause_end}")
 
                 queue_stop_object = PrioritizedItem(pause_end, post_pause)
-                self.event_queue.put(queue_stop_object)
+                heapq.heappush(self.event_queue, queue_stop_object)
                 return
             elif event == 0x90:
                 pause_end = (self.current_tick + self.last_delay[track_id]) * 2 + 1
@@ -177,7 +178,7 @@ class SMDLSequencer:
                     logging.debug(f"{prefix}Pause 2 ending on {pause_end}")
 
                 queue_stop_object = PrioritizedItem(pause_end, post_pause)
-                self.event_queue.put(queue_stop_object)
+                heapq.heappush(self.event_queue, queue_stop_object)
                 return
             elif event == 0x91:
                 self.last_delay[track_id] += track_br.read_uint8()
@@ -187,7 +188,7 @@ class SMDLSequencer:
                     logging.debug(f"{prefix}Pause 3 ending on {pause_end}")
 
                 queue_stop_object = PrioritizedItem(pause_end, post_pause)
-                self.event_queue.put(queue_stop_object)
+                heapq.heappush(self.event_queue, queue_stop_object)
                 return
             elif event == 0x92:
                 self.last_delay[track_id] = track_br.read_uint8()
@@ -197,7 +198,7 @@ class SMDLSequencer:
                     logging.debug(f"{prefix}Pause 4 ending on {pause_end}, {self.last_delay[track_id]}")
 
                 queue_stop_object = PrioritizedItem(pause_end, post_pause)
-                self.event_queue.put(queue_stop_object)
+                heapq.heappush(self.event_queue, queue_stop_object)
                 return
             elif event == 0x93:
                 a = track_br.read_uint16()
@@ -208,7 +209,7 @@ class SMDLSequencer:
                     logging.debug(f"{prefix}Pause 5 ending on {pause_end}")
 
                 queue_stop_object = PrioritizedItem(pause_end, post_pause)
-                self.event_queue.put(queue_stop_object)
+                heapq.heappush(self.event_queue, queue_stop_object)
                 return
             elif event == 0x94:
                 a = track_br.read_uint16()
@@ -220,7 +221,7 @@ class SMDLSequencer:
                     logging.debug(f"{prefix}Pause 6 ending on {pause_end}")
 
                 queue_stop_object = PrioritizedItem(pause_end, post_pause)
-                self.event_queue.put(queue_stop_object)
+                heapq.heappush(self.event_queue, queue_stop_object)
                 return
             elif event == 0x99:
                 self.loop_start[track_id] = track_br.tell()
@@ -321,39 +322,38 @@ class SMDLSequencer:
         self.completed = False
         self.loop_start = [-1] * len(self.smd_obj.tracks)
         self.octave = [0] * len(self.smd_obj.tracks)
-        self.event_queue = PriorityQueue()
+        self.event_queue = []
 
     def generate_samples(self, ticks_to_create=0):
-        samples = np.zeros((0, 2), dtype=np.int16)
         if not self.get_dependencies_met():
-            return samples
+            return np.zeros((0, 2), dtype=np.int16)
+        # Joined once at the end, appending each array would copy all previous samples every time
+        sample_arrays = [np.zeros((0, 2), dtype=np.int16)]
         start_tick = self.current_tick
-        if self.event_queue.empty() and not self.completed:
+        if not self.event_queue and not self.completed:
             for i in range(len(self.tracks_br)):
                 if i != self.TRACK_SELECT and self.TRACK_SELECT > 0:
                     continue
                 track_start = PrioritizedItem(0, lambda track_id=i: self.read_events(track_id))
-                self.event_queue.put(track_start)
-        while not self.event_queue.empty():
-            task: PrioritizedItem = self.event_queue.get()
+                heapq.heappush(self.event_queue, track_start)
+        while self.event_queue:
+            task: PrioritizedItem = heapq.heappop(self.event_queue)
             task_start = task.priority
             task_function = task.item
             ticks_to_do = (task_start // 2) - self.current_tick
             if ticks_to_do > 0:
-                array = self.generate_samples_from_ticks(ticks_to_do)
-                samples = np.append(samples, array, axis=0)
+                sample_arrays.append(self.generate_samples_from_ticks(ticks_to_do))
                 self.current_tick = task_start // 2
             if callable(task_function):
                 task_function()
             if self.current_tick - start_tick >= ticks_to_create > 0 and not (ticks_to_create == -1 and not self.loops):
-                return samples
+                return np.concatenate(sample_arrays, axis=0)
         if self.current_tick - start_tick < ticks_to_create and not (ticks_to_create == -1 and not self.loops):
             ticks_to_do = (start_tick + ticks_to_create) - self.current_tick
-            array = self.generate_samples_from_ticks(ticks_to_do)
-            samples = np.append(samples, array, axis=0)
+            sample_arrays.append(self.generate_samples_from_ticks(ticks_to_do))
             self.current_tick = start_tick + ticks_to_create
         self.completed = True
-        return samples
+        return np.concatenate(sample_arrays, axis=0)
 
     @staticmethod
     def get_dependencies_met():
@@ -3,6 +3,7 @@ from typing import List
 from formats.sound.smdl.SMDLSequencer import SMDLSequencer
 from formats.sound.smdl import smdl
 import mido
+import numpy as np
 
 
 class SMDLMidiSequencer(SMDLSequencer):
@@ -78,6 +79,10 @@ class SMDLMidiSequencer(SMDLSequencer):
         track.append(mido.Message('control_change', channel=channel, control=0x0a, value=pan))
         self.set_time_delta(channel)
 
+    def generate_samples_from_ticks(self, ticks) -> np.ndarray:
+        # Only the MIDI events are needed, so no audio is generated
+        return np.zeros((0, 2), dtype=np.int16)
+
     def generate_mid(self) -> mido.MidiFile:
         self.generate_samples(-1)
         return self.midi_file
@@ -0,0 +1,61 @@
+from PySide6 import QtCore, QtWidgets
+from typing import Any, Callable, Optional
+
+
+class BackgroundTaskSignals(QtCore.QObject):
+    finished = QtCore.Signal()
+
+
+class BackgroundTask(QtCore.QRunnable):
+    """
+    Runs a function on the global thread pool, so that long operations (such as compressing all the
+    archives of a ROM) don't freeze the GUI.
+    """
+    def __init__(self, function: Callable, *args, **kwargs):
+        super(BackgroundTask, self).__init__()
+        self.setAutoDelete(False)  # We read the result after the task has finished.
+        self.signals = BackgroundTaskSignals()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        try:
+            self.result = self.function(*self.args, **self.kwargs)
+        except BaseException as e:
+            self.error = e
+        self.signals.finished.emit()
+
+    def exec(self, parent: QtWidgets.QWidget, text: str) -> Any:
+        """
+        Runs the task while showing a modal busy dialog, and waits for it to finish while the GUI keeps
+        processing events.
+
+        Parameters
+        ----------
+        parent : QtWidgets.QWidget
+            The parent of the busy dialog.
+        text : str
+            The text shown in the busy dialog.
+
+        Returns
+        -------
+        Any
+            The value returned by the function. Exceptions raised by the function are raised again here.
+        """
+        busy_dialog = QtWidgets.QProgressDialog(text, None, 0, 0, parent)
+        busy_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        busy_dialog.setMinimumDuration(0)
+        busy_dialog.show()
+
+        loop = QtCore.QEventLoop()
+        self.signals.finished.connect(loop.quit)
+        QtCore.QThreadPool.globalInstance().start(self)
+        loop.exec()
+
+        busy_dialog.close()
+        if self.error is not None:
+            raise self.error
+        return self.result
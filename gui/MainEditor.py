@@ -11,12 +11,13 @@ from pg_utils.sound.SADLStreamPlayer import SADLStreamPlayer
 from pg_utils.sound.SMDLStreamPlayer import SMDLStreamPlayer
 from pg_utils.rom.RomSingleton import RomSingleton
 from .PygamePreviewer import PygamePreviewer
+from .BackgroundTask import BackgroundTask
 
 from formats.filesystem import NintendoDSRom
 from formats import conf
 
 import logging
-from typing import Union
+from typing import Dict, Union
 import qdarktheme
 from .SettingsManager import SettingsManager
 
@@ -34,9 +35,6 @@ class MainEditor(MainEditorUI):
         self.tree_model = EditorTree()
         self.file_tree.setModel(self.tree_model)
 
-        self.pg_previewer = PygamePreviewer()
-        self.pg_previewer.start()
-
         self.event_editor = EventEditor(self)
         self.puzzle_editor = PuzzleEditor(self)
         self.text_editor = TextEditor(self)
@@ -63,6 +61,27 @@ class MainEditor(MainEditorUI):
 
         self.active_editor = self.empty_editor
 
+        # Context menu actions by name, reused between menus and reconnected to the current callback.
+        self._ft_context_actions: Dict[str, QtGui.QAction] = {}
+
+        # Handlers opening each kind of node, they return whether a previewer was started.
+        self._node_handlers = {
+            EventNode: self._open_event_node,
+            PuzzleNode: self._open_puzzle_node,
+            TextAsset: self._open_text_asset,
+            ScriptAsset: self._open_script_asset,
+            SADLNode: self._open_sadl_node,
+            SMDLNode: self._open_smdl_node,
+            PlaceVersion: self._open_place_version,
+            BackgroundAsset: self._open_background_asset,
+            SpriteAsset: self._open_sprite_asset,
+        }
+
+    @property
+    def pg_previewer(self) -> PygamePreviewer:
+        # The previewer window and its thread are only created once something is previewed.
+        return PygamePreviewer.get_instance()
+
     def file_menu_open(self):
         if self.last_path is not None:
             if not self.unsaved_data_dialog():
@@ -71,7 +90,7 @@ class MainEditor(MainEditorUI):
         if file_path == "":
             return
 
-        rom = NintendoDSRom.fromFile(file_path)
+        rom = BackgroundTask(NintendoDSRom.fromFile, file_path).exec(self, "Opening ROM...")
 
         # Load language from arm9
         if rom.name == b"LAYTON2":
@@ -110,14 +129,14 @@ class MainEditor(MainEditorUI):
         if not self.overwrite_data_dialogue():
             return
         if self.last_path:
-            self.rom.saveToFile(self.last_path)
+            BackgroundTask(self.rom.saveToFile, self.last_path).exec(self, "Saving ROM...")
 
     def file_menu_save_as(self):
         file_path = SettingsManager().save_rom(self)
         if file_path == "":
             return
         self.last_path = file_path
-        self.rom.saveToFile(file_path)
+        BackgroundTask(self.rom.saveToFile, file_path).exec(self, "Saving ROM...")
 
     def file_tree_context_menu(self, point: QtCore.QPoint):
         index = self.file_tree.indexAt(point)
@@ -132,7 +151,12 @@ class MainEditor(MainEditorUI):
                     self.ft_context_menu.addSeparator()
                     continue
                 name, callback = action_data
-                action = QtGui.QAction(name, self.ft_context_menu)
+                action = self._ft_context_actions.get(name)
+                if action is None:
+                    # Owned by the editor, so clearing the menu does not delete it.
+                    action = self._ft_context_actions[name] = QtGui.QAction(name, self)
+                else:
+                    action.triggered.disconnect()
                 action.triggered.connect(callback)
                 self.ft_context_menu.addAction(action)
             self.ft_context_menu.exec(self.file_tree.mapToGlobal(point))
@@ -150,60 +174,78 @@ class MainEditor(MainEditorUI):
 
         set_previewer = False
 
-        if isinstance(node, EventNode):
-            self.active_editor = self.event_editor
-            event = node.get_event()
-            self.event_editor.set_event(event)
-
-            self.pg_previewer.start_renderer(EventPlayer(event))
-            set_previewer = True
-        elif isinstance(node, PuzzleNode):
-            self.active_editor = self.puzzle_editor
-            puzzle = node.get_puzzle()
-            self.puzzle_editor.set_puzzle(puzzle)
-
-            self.pg_previewer.start_renderer(get_puzzle_player(puzzle))
-            set_previewer = True
-        elif isinstance(node, TextAsset):
-            self.active_editor = self.text_editor
-            self.text_editor.set_text(node)
-        elif isinstance(node, ScriptAsset):
-            self.active_editor = self.script_editor
-            self.script_editor.set_script(node.to_gds())
-        elif isinstance(node, SADLNode):
-            sadl_player = SADLStreamPlayer()
-            self.pg_previewer.start_renderer(SoundPreview(sadl_player, node.get_sadl(),
-                                                          node.data()))
-            set_previewer = True
-        elif isinstance(node, SMDLNode):
-            smdl_player = SMDLStreamPlayer()
-            smdl, swdl = node.get_smdl(), node.get_swdl()
-            sample_bank = node.sample_bank()
-            smdl_player.create_temporal_sf2(swdl, sample_bank)
-            self.pg_previewer.start_renderer(SoundPreview(smdl_player, smdl,
-                                                          node.data()))
-            set_previewer = True
-        elif isinstance(node, PlaceVersion):
-            self.active_editor = self.place_editor
-            self.place_editor.set_place(node.get_place())
-
-            self.pg_previewer.start_renderer(PlacePreview(node.get_place()))
-            set_previewer = True
-        elif isinstance(node, BackgroundAsset):
-            self.active_editor = self.background_editor
-            self.background_editor.set_image(node.get_bg())
-        elif isinstance(node, SpriteAsset):
-            self.active_editor = self.sprite_editor
-            self.sprite_editor.set_sprite(node.get_sprite())
+        for node_type in type(node).__mro__:
+            handler = self._node_handlers.get(node_type)
+            if handler is not None:
+                set_previewer = handler(node)
+                break
 
         if self.active_editor is None:
             self.active_editor = self.empty_editor
 
-        if not set_previewer:
+        if not set_previewer and PygamePreviewer.INSTANCE is not None:
             self.pg_previewer.stop_renderer()
 
         self.active_editor.show()
 
+    def _open_event_node(self, node: EventNode) -> bool:
+        self.active_editor = self.event_editor
+        event = node.get_event()
+        self.event_editor.set_event(event)
+
+        self.pg_previewer.start_renderer(EventPlayer(event))
+        return True
+
+    def _open_puzzle_node(self, node: PuzzleNode) -> bool:
+        self.active_editor = self.puzzle_editor
+        puzzle = node.get_puzzle()
+        self.puzzle_editor.set_puzzle(puzzle)
+
+        self.pg_previewer.start_renderer(get_puzzle_player(puzzle))
+        return True
+
+    def _open_text_asset(self, node: TextAsset) -> bool:
+        self.active_editor = self.text_editor
+        self.text_editor.set_text(node)
+        return False
+
+    def _open_script_asset(self, node: ScriptAsset) -> bool:
+        self.active_editor = self.script_editor
+        self.script_editor.set_script(node.to_gds())
+        return False
+
+    def _open_sadl_node(self, node: SADLNode) -> bool:
+        sadl_player = SADLStreamPlayer()
+        self.pg_previewer.start_renderer(SoundPreview(sadl_player, node.get_sadl(),
+                                                      node.data()))
+        return True
+
+    def _open_smdl_node(self, node: SMDLNode) -> bool:
+        smdl_player = SMDLStreamPlayer()
+        smdl, swdl = node.get_smdl(), node.get_swdl()
+        sample_bank = node.sample_bank()
+        smdl_player.create_temporal_sf2(swdl, sample_bank)
+        self.pg_previewer.start_renderer(SoundPreview(smdl_player, smdl,
+                                                      node.data()))
+        return True
+
+    def _open_place_version(self, node: PlaceVersion) -> bool:
+        self.active_editor = self.place_editor
+        self.place_editor.set_place(node.get_place())
+
+        self.pg_previewer.start_renderer(PlacePreview(node.get_place()))
+        return True
+
+    def _open_background_asset(self, node: BackgroundAsset) -> bool:
+        self.active_editor = self.background_editor
+        self.background_editor.set_image(node.get_bg())
+        return False
+
+    def _open_sprite_asset(self, node: SpriteAsset) -> bool:
+        self.active_editor = self.sprite_editor
+        self.sprite_editor.set_sprite(node.get_sprite())
+        return False
+
     def unsaved_data_dialog(self):
         ret = QtWidgets.QMessageBox.warning(self, "Unsaved data", "Any unsaved data will be lost. Continue?",
                                             buttons=QtWidgets.QMessageBox.StandardButton.Yes |
@@ -217,6 +259,8 @@ class MainEditor(MainEditorUI):
         return ret != QtWidgets.QMessageBox.StandardButton.No
 
     def closeEvent(self, event) -> None:
+        if PygamePreviewer.INSTANCE is None:
+            return
         self.pg_previewer.loop_lock.acquire()
         self.pg_previewer.gm.exit()
         self.pg_previewer.loop_lock.release()
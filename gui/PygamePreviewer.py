@@ -46,6 +46,13 @@ class PygamePreviewer(threading.Thread):
         self.loop_lock = threading.Lock()
         PygamePreviewer.INSTANCE = self
 
+    @classmethod
+    def get_instance(cls) -> "PygamePreviewer":
+        """Returns the previewer, creating it and starting its thread the first time something is previewed."""
+        if cls.INSTANCE is None:
+            cls().start()
+        return cls.INSTANCE
+
     def run(self) -> None:
         while self.gm.running:
             self.gm.tick()
@@ -96,7 +96,7 @@ class MoviesCategory(FilesystemCategory):
         if asset.has_audio():
             sound_previewer = SoundPreview(SADLStreamPlayer(), asset.get_sad(),
                                            f"Movie {asset.get_num()}")
-            PygamePreviewer.INSTANCE.start_renderer(sound_previewer)
+            PygamePreviewer.get_instance().start_renderer(sound_previewer)
             sound_previewer.start_sound()
 
     def import_wav(self, index: QtCore.QModelIndex, refresh_callback: Callable):
@@ -20,6 +20,8 @@ class EventEditor(EventWidgetUI):
         super(EventEditor, self).__init__()
         self.event = None
         self.main_editor: MainEditor = main_editor
+        # The script of the event is only serialized when the Script tab is shown or its text is needed.
+        self.script_outdated = False
 
     def get_event_properties_widget(self):
         return EventPropertiesWidget(self)
@@ -27,11 +29,24 @@ class EventEditor(EventWidgetUI):
     def set_event(self, ev: Event):
         self.event = ev
         self.character_widget.set_event(ev)
-        dcc_text = EventDCC(ev)
+        self.script_outdated = True
+        if self.tab_widget.currentWidget() is self.text_editor:
+            self.update_script_text()
+
+    def update_script_text(self):
+        if not self.script_outdated:
+            return
+        self.script_outdated = False
+        dcc_text = EventDCC(self.event)
         serialized = dcc_text.serialize(include_character=False)
         self.text_editor.setPlainText(serialized)
 
+    def tab_changed(self, index: int):
+        if self.tab_widget.widget(index) is self.text_editor:
+            self.update_script_text()
+
     def preview_dcc_btn_click(self):
+        self.update_script_text()
         text = self.text_editor.toPlainText()
         is_ok, error = EventDCC(self.event).parse(text, include_character=False)
         if is_ok:
@@ -40,6 +55,7 @@ class EventEditor(EventWidgetUI):
             logging.error(f"Error compiling DCC: {error}")
 
     def save_dcc_btn_click(self):
+        self.update_script_text()
         text = self.text_editor.toPlainText()
         is_ok, error = EventDCC(self.event).parse(text, include_character=False)
         if is_ok:
@@ -49,6 +65,7 @@ class EventEditor(EventWidgetUI):
             logging.error(f"Error compiling DCC: {error}")
 
     def preview_ev_script_btn_click(self):
+        self.update_script_text()
         text = self.text_editor.toPlainText()
         try:
             ev_script = EventScript(text, self.event)
@@ -59,6 +76,7 @@ class EventEditor(EventWidgetUI):
             logging.error(f"Error compiling EventScript: {e}")
 
     def save_ev_script_btn_click(self):
+        self.update_script_text()
         text = self.text_editor.toPlainText()
         try:
             ev_script = EventScript(text, self.event)
@@ -1,14 +1,16 @@
 from PySide6 import QtCore, QtWidgets, QtGui
 from formats.graphics.ani import AniSprite, Animation, AnimationFrame
 from typing import List, Callable
+from .SpriteImagePixmaps import ImagePixmaps
 
 
 class FramesModel(QtCore.QAbstractListModel):
-    def __init__(self, update_frame_next: Callable):
+    def __init__(self, update_frame_next: Callable, pixmaps: ImagePixmaps):
         super(FramesModel, self).__init__()
         self.sprite: AniSprite = None
         self.animation: Animation = None
         self.update_frame_next = update_frame_next
+        self.pixmaps = pixmaps
 
     def set_animation(self, sprite: AniSprite, anim_index: int):
         self.layoutAboutToBeChanged.emit()
@@ -29,7 +31,7 @@ class FramesModel(QtCore.QAbstractListModel):
             return frame_idx
         if role == QtCore.Qt.ItemDataRole.DecorationRole:
             frame = self.animation.frames[frame_idx]
-            return QtGui.QIcon(self.sprite.extract_image_qt(frame.image_index))
+            return QtGui.QIcon(self.pixmaps.get(self.sprite, frame.image_index))
         return None
 
     def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
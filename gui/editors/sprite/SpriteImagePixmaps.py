@@ -0,0 +1,25 @@
+import weakref
+from PySide6 import QtGui
+from formats.graphics.ani import AniSprite
+
+
+class ImagePixmaps:
+    """
+    Pixmaps of the images of a sprite, shared by the lists showing them.
+
+    Editing the images replaces the image arrays (and the palette), so an entry is only reused while both are the
+    same objects it was created from.
+    """
+    def __init__(self):
+        self._pixmaps = {}
+
+    def clear(self):
+        self._pixmaps.clear()
+
+    def get(self, sprite: AniSprite, image_index: int) -> QtGui.QPixmap:
+        image = sprite.images[image_index]
+        cached = self._pixmaps.get(id(image))
+        if cached is None or cached[0]() is not image or cached[1] is not sprite.palette:
+            cached = (weakref.ref(image), sprite.palette, sprite.extract_image_qt(image_index))
+            self._pixmaps[id(image)] = cached
+        return cached[2]
@@ -3,16 +3,19 @@ from formats.graphics.ani import AniSprite
 from typing import List
 from PIL import Image
 from gui.SettingsManager import SettingsManager
+from .SpriteImagePixmaps import ImagePixmaps
 
 
 class ImagesModel(QtCore.QAbstractListModel):
-    def __init__(self):
+    def __init__(self, pixmaps: ImagePixmaps):
         super(ImagesModel, self).__init__()
         self.sprite: AniSprite = None
+        self.pixmaps = pixmaps
 
     def set_sprite(self, sprite: AniSprite):
         self.layoutAboutToBeChanged.emit()
         self.sprite = sprite
+        self.pixmaps.clear()
         self.layoutChanged.emit()
 
     def rowCount(self, parent: QtCore.QModelIndex) -> int:
@@ -21,7 +24,7 @@ class ImagesModel(QtCore.QAbstractListModel):
     def data(self, index: QtCore.QModelIndex, role: int = ...):
         if not index.isValid() or role != QtCore.Qt.ItemDataRole.DecorationRole:
             return None
-        return QtGui.QIcon(self.sprite.extract_image_qt(index.row()))
+        return QtGui.QIcon(self.pixmaps.get(self.sprite, index.row()))
 
     def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
         default_flags = super(ImagesModel, self).flags(index)
@@ -9,9 +9,11 @@ class SpriteEditor(SpriteWidgetUI):
         super(SpriteEditor, self).__init__(*args, **kwargs)
         self.sprite: AniSprite = None
         self.variables_model = VariablesModel()
-        self.images_model = ImagesModel()
+        # Both the image and the frame lists show the sprite images
+        self.image_pixmaps = ImagePixmaps()
+        self.images_model = ImagesModel(self.image_pixmaps)
         self.anims_model = AnimsModel()
-        self.frames_model = FramesModel(self.anim_properties.frame_order_edit)
+        self.frames_model = FramesModel(self.anim_properties.frame_order_edit, self.image_pixmaps)
         self.selected_frame: AnimationFrame = None
 
     def get_anim_properties_widget(self):
@@ -38,7 +40,7 @@ class SpriteEditor(SpriteWidgetUI):
             self.image_view.clear()
             return
         index = selected.row()
-        self.image_view.setPixmap(self.sprite.extract_image_qt(index))
+        self.image_view.setPixmap(self.image_pixmaps.get(self.sprite, index))
 
     def image_list_context_menu(self, point: QtCore.QPoint):
         index = self.image_list.indexAt(point)
@@ -103,13 +105,19 @@ class SpriteEditor(SpriteWidgetUI):
         self.selected_frame = animation.frames[selected.row()]
         self.frame_edit_data.show()
         if self.selected_frame.image_index < len(self.sprite.images):
-            self.frame_preview.setPixmap(self.sprite.extract_image_qt(self.selected_frame.image_index))
+            self.frame_preview.setPixmap(self.image_pixmaps.get(self.sprite, self.selected_frame.image_index))
+        # Showing the frame values must not write them back to the frame
+        inputs = [self.frame_image_index_input, self.frame_next_index_input, self.frame_duration_input]
+        for spin_box in inputs:
+            spin_box.blockSignals(True)
         self.frame_image_index_input.setRange(0, len(self.sprite.images) - 1)
         self.frame_next_index_input.setRange(0, len(animation.frames) - 1)
         self.frame_duration_input.setRange(0, 360)
         self.frame_image_index_input.setValue(self.selected_frame.image_index)
         self.frame_next_index_input.setValue(self.selected_frame.next_frame_index)
         self.frame_duration_input.setValue(self.selected_frame.duration)
+        for spin_box in inputs:
+            spin_box.blockSignals(False)
 
     def frame_context_menu(self, point: QtCore.QPoint):
         index = self.frame_list.indexAt(point)
@@ -132,7 +140,7 @@ class SpriteEditor(SpriteWidgetUI):
     def frame_image_index_changed(self, value: int):
         self.selected_frame.image_index = value
         if self.selected_frame.image_index < len(self.sprite.images):
-            self.frame_preview.setPixmap(self.sprite.extract_image_qt(self.selected_frame.image_index))
+            self.frame_preview.setPixmap(self.image_pixmaps.get(self.sprite, self.selected_frame.image_index))
 
     def frame_duration_changed(self, value: int):
         self.selected_frame.duration = value
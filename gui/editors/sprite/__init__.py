@@ -2,4 +2,5 @@ from .SpriteAnimPropertiesWidget import AnimPropertiesWidget
 from .SpriteAnimsModel import AnimsModel
 from .SpriteFramesModel import FramesModel
 from .SpriteImagesModel import ImagesModel
+from .SpriteImagePixmaps import ImagePixmaps
 from .SpriteVariablesModel import VariablesModel
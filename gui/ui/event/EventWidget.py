@@ -15,6 +15,7 @@ class EventWidgetUI(QtWidgets.QWidget):
 
         self.text_editor = QtWidgets.QPlainTextEdit(self.tab_widget)
         self.tab_widget.addTab(self.text_editor, "Script")
+        self.tab_widget.currentChanged.connect(self.tab_changed)
 
         self.btn_window_layout = QtWidgets.QGridLayout()
 
@@ -42,6 +43,9 @@ class EventWidgetUI(QtWidgets.QWidget):
     def get_event_properties_widget(self):
         return EventPropertiesWidgetUI(self)
 
+    def tab_changed(self, index: int):
+        pass
+
     def preview_dcc_btn_click(self):
         pass
 
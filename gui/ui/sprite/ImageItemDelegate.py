@@ -0,0 +1,22 @@
+from PySide6 import QtCore, QtWidgets, QtGui
+
+
+class ImageItemDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Delegate for lists only showing images, all items have the same fixed size and only their icon is painted.
+    """
+    def __init__(self, item_size: QtCore.QSize, parent=None):
+        super(ImageItemDelegate, self).__init__(parent)
+        self.item_size = item_size
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        return self.item_size
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex):
+        style = option.widget.style() if option.widget else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+        icon: QtGui.QIcon = index.data(QtCore.Qt.ItemDataRole.DecorationRole)
+        if icon is not None:
+            # The view can stretch the item rect, keep the icon at the top of it.
+            icon_rect = QtCore.QRect(option.rect.topLeft(), self.item_size)
+            icon.paint(painter, icon_rect.marginsRemoved(QtCore.QMargins(4, 4, 4, 4)))
@@ -0,0 +1,16 @@
+from typing import Callable
+from PySide6 import QtCore, QtWidgets
+
+
+class SelectionListView(QtWidgets.QListView):
+    """
+    List view calling a function with the first selected index (or an invalid index) when its selection changes.
+    """
+    def __init__(self, on_selection: Callable[[QtCore.QModelIndex], None], parent=None):
+        super(SelectionListView, self).__init__(parent)
+        self.on_selection = on_selection
+
+    def selectionChanged(self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection):
+        super(SelectionListView, self).selectionChanged(selected, deselected)
+        indexes = selected.indexes()
+        self.on_selection(indexes[0] if indexes else QtCore.QModelIndex())
@@ -1,5 +1,7 @@
 from typing import List
 from .AnimPropertiesWidget import AnimPropertiesWidgetUI
+from .ImageItemDelegate import ImageItemDelegate
+from .SelectionListView import SelectionListView
 from PySide6 import QtCore, QtWidgets, QtGui
 
 
@@ -19,7 +21,7 @@ class SpriteWidgetUI(QtWidgets.QWidget):
 
         self.images_layout = QtWidgets.QVBoxLayout()
 
-        self.image_list = QtWidgets.QListView()
+        self.image_list = SelectionListView(self.image_list_selection)
         self.image_list.setFlow(QtWidgets.QListView.Flow.LeftToRight)
         self.image_list.setViewMode(QtWidgets.QListView.ViewMode.ListMode)
         self.image_list.setMovement(QtWidgets.QListView.Movement.Snap)
@@ -30,7 +32,11 @@ class SpriteWidgetUI(QtWidgets.QWidget):
         self.image_list.setAcceptDrops(True)
         self.image_list.setDragEnabled(True)
         self.image_list.setDropIndicatorShown(True)
-        self.image_list.selectionChanged = self.image_list_selection_ui
+        # Sprites can have many images, so all items share one size and are laid out in batches.
+        self.image_list.setUniformItemSizes(True)
+        self.image_list.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.image_list.setBatchSize(64)
+        self.image_list.setItemDelegate(ImageItemDelegate(QtCore.QSize(108, 108), self.image_list))
         self.image_list.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.image_list.customContextMenuRequested.connect(self.image_list_context_menu)
         self.images_layout.addWidget(self.image_list, 1)
@@ -44,7 +50,7 @@ class SpriteWidgetUI(QtWidgets.QWidget):
         self.animations_tab = QtWidgets.QWidget()
         self.anim_layout = QtWidgets.QVBoxLayout()
 
-        self.anim_list = QtWidgets.QListView()
+        self.anim_list = SelectionListView(self.anim_change_selection)
         self.anim_list.setFlow(QtWidgets.QListView.Flow.TopToBottom)
         self.anim_list.setViewMode(QtWidgets.QListView.ViewMode.ListMode)
         self.anim_list.setMovement(QtWidgets.QListView.Movement.Snap)
@@ -54,7 +60,9 @@ class SpriteWidgetUI(QtWidgets.QWidget):
         self.anim_list.setAcceptDrops(True)
         self.anim_list.setDragEnabled(True)
         self.anim_list.setDropIndicatorShown(True)
-        self.anim_list.selectionChanged = self.anim_change_selection_ui
+        self.anim_list.setUniformItemSizes(True)
+        self.anim_list.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.anim_list.setBatchSize(64)
         self.anim_list.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.anim_list.customContextMenuRequested.connect(self.anim_context_menu)
         self.anim_layout.addWidget(self.anim_list, 1)
@@ -64,7 +72,7 @@ class SpriteWidgetUI(QtWidgets.QWidget):
         self.frame_edit_widget = QtWidgets.QWidget()
         self.frame_edit_layout = QtWidgets.QHBoxLayout()
 
-        self.frame_list = QtWidgets.QListView()
+        self.frame_list = SelectionListView(self.frame_change_selection)
         self.frame_list.setFlow(QtWidgets.QListView.Flow.TopToBottom)
         self.frame_list.setViewMode(QtWidgets.QListView.ViewMode.ListMode)
         self.frame_list.setIconSize(QtCore.QSize(100, 100))
@@ -75,7 +83,9 @@ class SpriteWidgetUI(QtWidgets.QWidget):
         self.frame_list.setAcceptDrops(True)
         self.frame_list.setDragEnabled(True)
         self.frame_list.setDropIndicatorShown(True)
-        self.frame_list.selectionChanged = self.frame_change_selection_ui
+        self.frame_list.setUniformItemSizes(True)
+        self.frame_list.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.frame_list.setBatchSize(64)
         self.frame_list.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.frame_list.customContextMenuRequested.connect(self.frame_context_menu)
         self.frame_edit_layout.addWidget(self.frame_list, 1)
@@ -86,25 +96,22 @@ class SpriteWidgetUI(QtWidgets.QWidget):
         self.frame_preview = QtWidgets.QLabel()
         self.frame_edit_data_layout.addWidget(self.frame_preview)
 
-        self.frame_properties_layout = QtWidgets.QGridLayout()
+        self.frame_properties_layout = QtWidgets.QFormLayout()
 
         self.frame_next_index_label = QtWidgets.QLabel("Next Index")
-        self.frame_properties_layout.addWidget(self.frame_next_index_label, 0, 0)
         self.frame_next_index_input = QtWidgets.QSpinBox()
         self.frame_next_index_input.valueChanged.connect(self.frame_next_index_changed)
-        self.frame_properties_layout.addWidget(self.frame_next_index_input, 0, 1)
+        self.frame_properties_layout.addRow(self.frame_next_index_label, self.frame_next_index_input)
 
         self.frame_image_index_label = QtWidgets.QLabel("Image Index")
-        self.frame_properties_layout.addWidget(self.frame_image_index_label, 1, 0)
         self.frame_image_index_input = QtWidgets.QSpinBox()
         self.frame_image_index_input.valueChanged.connect(self.frame_image_index_changed)
-        self.frame_properties_layout.addWidget(self.frame_image_index_input, 1, 1)
+        self.frame_properties_layout.addRow(self.frame_image_index_label, self.frame_image_index_input)
 
         self.frame_duration_label = QtWidgets.QLabel("Duration")
-        self.frame_properties_layout.addWidget(self.frame_duration_label, 2, 0)
         self.frame_duration_input = QtWidgets.QSpinBox()
         self.frame_duration_input.valueChanged.connect(self.frame_duration_changed)
-        self.frame_properties_layout.addWidget(self.frame_duration_input, 2, 1)
+        self.frame_properties_layout.addRow(self.frame_duration_label, self.frame_duration_input)
 
         self.frame_edit_data_layout.addLayout(self.frame_properties_layout)
 
@@ -136,13 +143,6 @@ class SpriteWidgetUI(QtWidgets.QWidget):
     def get_anim_properties_widget(self):
         return AnimPropertiesWidgetUI(self)
 
-    def image_list_selection_ui(self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection):
-        QtWidgets.QListView.selectionChanged(self.image_list, selected, deselected)
-        if selected.indexes():
-            self.image_list_selection(selected.indexes()[0])
-        else:
-            self.image_list_selection(QtCore.QModelIndex())
-
     def image_list_selection(self, selected: QtCore.QModelIndex):
         pass
 
@@ -152,26 +152,12 @@ class SpriteWidgetUI(QtWidgets.QWidget):
     def save_btn_click(self):
         pass
 
-    def anim_change_selection_ui(self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection):
-        QtWidgets.QListView.selectionChanged(self.anim_list, selected, deselected)
-        if selected.indexes():
-            self.anim_change_selection(selected.indexes()[0])
-        else:
-            self.anim_change_selection(QtCore.QModelIndex())
-
     def anim_change_selection(self, selected: QtCore.QModelIndex):
         pass
 
     def anim_context_menu(self, point: QtCore.QPoint):
         pass
 
-    def frame_change_selection_ui(self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection):
-        QtWidgets.QListView.selectionChanged(self.anim_list, selected, deselected)
-        if selected.indexes():
-            self.frame_change_selection(selected.indexes()[0])
-        else:
-            self.frame_change_selection(QtCore.QModelIndex())
-
     def frame_change_selection(self, selected: QtCore.QModelIndex):
         pass
 
@@ -8,13 +8,16 @@ from k4pg import Alignment
 class Camera:
     def __init__(self, surf: pg.Surface, world_position: pg.Vector2 = None, alignment: pg.Vector2 = None,
                  viewport: [pg.Rect, list, tuple] = None, zoom: pg.Vector2 = None):
+        # Screen position of the world origin, recalculated when the viewport or the alignment are set
+        self._screen_origin: Union[pg.Vector2, None] = None
+
         self.world_position = pg.Vector2(0, 0)
         if world_position is not None:
             self.world_position.update(world_position)
 
         self.alignment = pg.Vector2(Alignment.CENTER, Alignment.CENTER)
         if alignment is not None:
-            self.alignment.update(alignment)
+            self.alignment = pg.Vector2(alignment)
 
         self.zoom = pg.Vector2(1, 1)
         if zoom is not None:
@@ -22,25 +25,47 @@ class Camera:
 
         if viewport is not None:
             self.viewport = viewport
-            if not isinstance(self.viewport, pg.Rect):
-                self.viewport = pg.Rect(self.viewport)
         else:
             self.viewport = pg.Rect(0, 0, surf.get_width(), surf.get_height())
         self.surf = surf
 
+    # The viewport and the alignment have to be set again after being modified, so the screen origin is updated.
+    @property
+    def viewport(self) -> pg.Rect:
+        return self._viewport
+
+    @viewport.setter
+    def viewport(self, v: Union[pg.Rect, List, Tuple]):
+        self._viewport = v if isinstance(v, pg.Rect) else pg.Rect(v)
+        self._screen_origin = None
+
+    @property
+    def alignment(self) -> pg.Vector2:
+        return self._alignment
+
+    @alignment.setter
+    def alignment(self, v: pg.Vector2):
+        self._alignment = v
+        self._screen_origin = None
+
+    @property
+    def screen_origin(self) -> pg.Vector2:
+        if self._screen_origin is None:
+            self._screen_origin = pg.Vector2(self._viewport.x + self._viewport.w * self._alignment.x,
+                                             self._viewport.y + self._viewport.h * self._alignment.y)
+        return self._screen_origin
+
     def to_screen(self, point: Union[pg.Vector2, List, Tuple], use_world=True) -> pg.Vector2:
         point = pg.Vector2(point)
         if use_world:
             point -= self.world_position
         point *= self.zoom.elementwise()
-        point += pg.Vector2(self.viewport[0], self.viewport[1])
-        point += pg.Vector2(self.viewport[2], self.viewport[3]) * self.alignment.elementwise()
+        point += self.screen_origin
         return point
 
     def from_screen(self, point: Union[pg.Vector2, List, Tuple], use_world=True) -> pg.Vector2:
         point = pg.Vector2(point)
-        point -= pg.Vector2(self.viewport[2], self.viewport[3]) * self.alignment.elementwise()
-        point -= pg.Vector2(self.viewport[0], self.viewport[1])
+        point -= self.screen_origin
         point /= self.zoom.elementwise()
         if use_world:
             point += self.world_position
@@ -6,6 +6,8 @@ from ..Alignment import Alignment
 
 
 class Font:
+    LINE_CACHE_SIZE = 128
+    _line_cache: Dict[tuple, Tuple[pg.Surface, pg.Color]] = None
 
     def render(self, text: str, color: pg.Color, bg_color: pg.Color, line_spacing=0,
                h_align: int = Alignment.LEFT) -> Tuple[pg.Surface, Any]:
@@ -15,25 +17,45 @@ class Font:
             bg_color = pg.Color(255 - color.r, 255 - color.g, 255 - color.b)
         self._set_color(color)
         self._set_bg_color(bg_color)
-        widths, heights = list(), list()
-        for line in lines:
-            w, h = self._get_line_size(line)
-            widths.append(w)
-            heights.append(h)
+        line_surfs = [self._get_line_surf(line, bg_color) for line in lines]
+        widths = [line_surf.get_width() for line_surf in line_surfs]
+        heights = [line_surf.get_height() for line_surf in line_surfs]
         surf_w = max(widths)
         surf_h = sum(heights) + line_spacing * (len(heights) - 1)
         surf = pg.Surface((surf_w, surf_h))
         surf.fill(bg_color)
         current_y = 0
-        for i, line in enumerate(lines):
+        for i, line_surf in enumerate(line_surfs):
             w, h = widths[i], heights[i]
             line_surf_pos = (int(surf_w * h_align - w * h_align), current_y)
-            self._render_line(surf, line_surf_pos, line)
+            surf.blit(line_surf, line_surf_pos)
             current_y += h + line_spacing
         if alpha:
             return surf, bg_color
         return surf, None
 
+    def _get_line_surf(self, line: str, bg_color: pg.Color) -> pg.Surface:
+        # Text is often rendered again with only its last line changed (text appearing letter by letter), so
+        # lines are rendered separately and cached along with the color the font is left with after them.
+        if self._line_cache is None:
+            self._line_cache = {}
+        key = (line, tuple(self._get_color()), tuple(bg_color))
+        cached = self._line_cache.get(key)
+        if cached is None:
+            line_surf = pg.Surface(self._get_line_size(line))
+            line_surf.fill(bg_color)
+            self._render_line(line_surf, (0, 0), line)
+            cached = (line_surf, pg.Color(self._get_color()))
+            if len(self._line_cache) >= self.LINE_CACHE_SIZE:
+                self._line_cache.clear()
+            self._line_cache[key] = cached
+        else:
+            self._set_color(cached[1])
+        return cached[0]
+
+    def _get_color(self) -> pg.Color:
+        pass
+
     def _set_color(self, color: pg.Color):
         pass
 
@@ -56,6 +78,9 @@ class PygameFont(Font):
     def _set_color(self, color: pg.Color):
         self._color = color
 
+    def _get_color(self) -> pg.Color:
+        return self._color
+
     def _set_bg_color(self, bg_color: pg.Color):
         self._bg_color = bg_color
 
@@ -132,6 +157,9 @@ class FontMap(Font):
         pg.transform.threshold(self._font_surface, self._font_surface, self._color, set_color=color, inverse_set=True)
         self._color = color
 
+    def _get_color(self) -> pg.Color:
+        return self._color
+
     def _render_line(self, surf: pg.Surface, pos: Tuple[int, int], text: str):
         pos = list(pos)
         i = 0
@@ -163,10 +163,17 @@ class Sprite(Renderable):
             return None
         return self._tag_info.index(self._active_tag)
 
+    @property
+    def is_animating(self) -> bool:
+        # Whether calling animate can change the current frame
+        tag = self._active_tag
+        if tag is None or len(tag.frames) <= 1:
+            return False
+        return self.loop_tag or self._tag_frame < len(tag.frames) - 1
+
     def animate(self, dt: float):
-        if not self._tag_info:
-            pass
-        if self._active_tag not in self._tag_info:
+        # The active tag always comes from _tag_info, checking it is set avoids comparing it against every tag.
+        if self._active_tag is None:
             return
         tag = self._active_tag
         if len(self._active_tag.frames) == 0:
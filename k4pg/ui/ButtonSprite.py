@@ -17,8 +17,11 @@ class ButtonSprite(Button, Sprite):
             self.set_tag(self.not_pressed_tag)
 
     def get_hover(self, cam):
+        # Hidden buttons (such as the submit button of some puzzle types) skip computing their screen rect.
+        if not self.visible:
+            return False
         mouse_pos = self.inp.get_mouse_pos()
-        if self.get_screen_rect(cam)[0].collidepoint(mouse_pos[0], mouse_pos[1]) and self.visible:
+        if self.get_screen_rect(cam)[0].collidepoint(mouse_pos[0], mouse_pos[1]):
             return True
         return False
 
@@ -15,6 +15,10 @@ from utility.path import set_extension
 
 
 class SpriteLoaderROM(k4pg.SpriteLoaderOS):
+    ROM_CACHE = {}
+    """Decoded sprites by ROM path, along with the file data they were decoded from."""
+    ROM_CACHE_SIZE = 64
+
     def __init__(self, rom: NintendoDSRom, base_path_rom=None, base_path_os=None):
         super(SpriteLoaderROM, self).__init__(base_path_os=base_path_os)
         self._base_path_rom = base_path_rom
@@ -35,6 +39,25 @@ class SpriteLoaderROM(k4pg.SpriteLoaderOS):
             super().load(path + ".png", sprite, sprite_sheet=sprite_sheet, convert_alpha=convert_alpha,
                          do_copy=do_copy)
             return
+
+        # The file data is replaced when the file is written, so a cached sprite is only reused if it is unchanged.
+        file_data = self.rom.files[self.rom.filenames.idOf(path)]
+        cached = SpriteLoaderROM.ROM_CACHE.pop(path, None)
+        if cached is None or cached[0] is not file_data:
+            cached = (file_data, *self._decode(path, sprite_sheet))
+            if len(SpriteLoaderROM.ROM_CACHE) >= SpriteLoaderROM.ROM_CACHE_SIZE:
+                # Drop the least recently used sprite
+                SpriteLoaderROM.ROM_CACHE.pop(next(iter(SpriteLoaderROM.ROM_CACHE)))
+        SpriteLoaderROM.ROM_CACHE[path] = cached
+
+        _, surf, frames, tags, vars_, color_key = cached
+        if not do_copy:
+            sprite.load_sprite(self, surf, frames, tags, vars_=vars_.copy())
+        else:
+            sprite.load_sprite(self, surf.copy(), frames.copy(), tags.copy(), vars_=vars_.copy())
+        sprite.color_key = color_key
+
+    def _decode(self, path: str, sprite_sheet: bool):
         frames = []
         tags = []
         vars_ = {}
@@ -83,8 +106,7 @@ class SpriteLoaderROM(k4pg.SpriteLoaderOS):
             img_array = np.swapaxes(img_array, 0, 1)
             surf = pg.surfarray.make_surface(img_array)
             color_key = None
-        sprite.load_sprite(self, surf, frames, tags, vars_=vars_)
-        sprite.color_key = color_key
+        return surf, frames, tags, vars_, color_key
 
 
 class FontLoaderROM(k4pg.FontLoaderOS):
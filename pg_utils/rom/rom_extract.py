@@ -1,5 +1,7 @@
+import io
 import os
 import shutil
+import threading
 
 from formats.sound.smdl import smdl
 from formats.sound import sadl
@@ -11,33 +13,73 @@ from pg_utils.rom import RomSingleton
 EXPORT_PATH = "data_extracted"
 ORIGINAL_FPS = 60
 
+# Loaded sounds by path, see decode_smd. Sounds are decoded on worker threads, so the cache is only used under the lock.
+SMD_CACHE = {}
+SMD_CACHE_SIZE = 8
+SMD_CACHE_LOCK = threading.Lock()
+
 
 def set_extension(path, ext):
     return ".".join(path.split(".")[:-1]) + ext
 
 
-def load_sadl(path: str, rom=None) -> sadl.SADL:
+def read_sadl(path: str, rom=None) -> bytes:
     if rom is None:
         rom = RomSingleton.RomSingleton().rom
     path = path.replace("?", conf.LANG)
-    sadl_obj = sadl.SADL(path, 0, rom=rom)
+    with rom.open(path, "rb") as file:
+        return file.read()
 
-    return sadl_obj
 
+def decode_sadl(data: bytes) -> sadl.SADL:
+    return sadl.SADL(file=io.BytesIO(data))
 
-def load_smd(path: str, rom=None) -> tuple:
+
+def load_sadl(path: str, rom=None) -> sadl.SADL:
+    return decode_sadl(read_sadl(path, rom))
+
+
+def read_smd(path: str, rom=None) -> tuple:
     if rom is None:
         rom = RomSingleton.RomSingleton().rom
     path = path.replace("?", conf.LANG)
+    swd_path = path.split(".")[0] + ".SWD"
+    sample_bank_path = "/".join(path.split("/")[:-1]) + "/BG_999.SWD"
 
-    smd_obj = smdl.SMDL(filename=path, rom=rom)
+    file_data = []
+    for file_path in (path, swd_path, sample_bank_path):
+        file_id = rom.filenames.idOf(file_path)
+        if file_id is None:
+            raise FileNotFoundError(f"file '{file_path}' could not be opened")
+        file_data.append(rom.files[file_id])
+    return path, file_data
 
-    swd_path = path.split(".")[0] + ".SWD"
-    swd_file = swdl.SWDL(swd_path, rom=rom)
 
-    sample_bank_path = "/".join(path.split("/")[:-1]) + "/BG_999.SWD"
-    sample_bank = swdl.SWDL(sample_bank_path, rom=rom)
-    return smd_obj, swd_file, sample_bank
+def decode_smd(path: str, file_data: list) -> tuple:
+    # The loaded objects are shared while the files in the ROM are unchanged, so the players must not modify them.
+    # The entries keep the file data they were loaded from, not the ROM, so a closed ROM can be freed.
+    with SMD_CACHE_LOCK:
+        cached = SMD_CACHE.pop(path, None)
+        if cached is not None and all(a is b for a, b in zip(cached[0], file_data)):
+            SMD_CACHE[path] = cached
+            return cached[1]
+
+    smd_data, swd_data, sample_bank_data = file_data
+    smd_obj = smdl.SMDL(file=io.BytesIO(smd_data))
+    swd_file = swdl.SWDL(file=io.BytesIO(swd_data))
+    sample_bank = swdl.SWDL(file=io.BytesIO(sample_bank_data))
+    loaded = smd_obj, swd_file, sample_bank
+
+    with SMD_CACHE_LOCK:
+        if len(SMD_CACHE) >= SMD_CACHE_SIZE:
+            # Drop the least recently used sound
+            SMD_CACHE.pop(next(iter(SMD_CACHE)), None)
+        SMD_CACHE[path] = (file_data, loaded)
+    return loaded
+
+
+def load_smd(path: str, rom=None) -> tuple:
+    return decode_smd(*read_smd(path, rom))
 
 
 def clear_extracted():
@@ -1,3 +1,4 @@
+import copy
 import os
 
 from formats.sound.smdl import smdl
@@ -47,8 +48,9 @@ class SMDLStreamPlayer(StreamPlayerAbstract):
 
     def create_temporal_sf2(self, swd_file: swdl.SWDL, sample_bank: swdl.SWDL):
         sf = sf2.SoundFont()
-        sf.samples = swd_file.samples
-        sf.programs = swd_file.programs
+        # The sample data is set on copies, as the loaded SWD files can be shared between players. They are copied
+        # together so the splits of the programs keep pointing to the samples of the sound font.
+        sf.samples, sf.programs = copy.deepcopy((swd_file.samples, swd_file.programs))
         sf.set_sample_data(sample_bank.samples)
         if not os.path.isdir(os.getcwd() + f"\\temporary"):
             os.mkdir(os.getcwd() + f"\\temporary")
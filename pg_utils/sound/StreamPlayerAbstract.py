@@ -26,6 +26,11 @@ class StreamPlayerAbstract:
 
         self.loops = loops
 
+    @property
+    def is_active(self):
+        # Whether update has anything to do
+        return self.playing or self.loading or self.fading
+
     def update(self, delta_time):
         if self.playing and not self.paused:
             self.expected_buffer_position += self.sample_rate * delta_time
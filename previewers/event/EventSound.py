@@ -1,6 +1,10 @@
+import logging
+import threading
+from collections import deque
+
 import pg_utils.sound.SADLStreamPlayer
 import pg_utils.sound.SMDLStreamPlayer
-from pg_utils.rom.rom_extract import load_sadl, load_smd
+from pg_utils.rom.rom_extract import decode_sadl, decode_smd, read_sadl, read_smd
 
 
 class EventSound:
@@ -10,28 +14,84 @@ class EventSound:
         self.bg_player = pg_utils.sound.SMDLStreamPlayer.SMDLStreamPlayer(loops=True)
         self.bg_player.set_volume(0.3)
 
+        # The ROM is read when a sound is requested, and only the decoding is done on worker threads. The sounds are
+        # started from update_, only the latest request of each player is started, the results of older requests are
+        # discarded.
+        self._smdl_token = 0
+        self._smdl_started_token = 0
+        self._smdl_loaded = deque()
+        self._smdl_fades = []
+        self._sadl_token = 0
+        self._sadl_loaded = deque()
+
+    def _load_smdl(self, token, path, file_data, vol):
+        try:
+            self._smdl_loaded.append((token, decode_smd(path, file_data), vol))
+        except Exception as e:
+            logging.error(f"Error loading SMDL {path}: {e}")
+
+    def _load_sadl(self, token, path, data):
+        try:
+            self._sadl_loaded.append((token, decode_sadl(data)))
+        except Exception as e:
+            logging.error(f"Error loading SADL {path}: {e}")
+
     def play_smdl(self, path, vol):
-        smd_obj, swd_file, sample_bank = load_smd(path)
-        self.bg_player.create_temporal_sf2(swd_file, sample_bank)
-        self.bg_player.load_sound(smd_obj)
-        self.bg_player.play()
-        self.bg_player.set_volume(vol)
+        self._smdl_token += 1
+        self._smdl_fades = []
+        try:
+            path, file_data = read_smd(path)
+        except Exception as e:
+            logging.error(f"Error reading SMDL {path}: {e}")
+            return
+        threading.Thread(target=self._load_smdl, args=(self._smdl_token, path, file_data, vol), daemon=True).start()
 
     def stop_smdl(self):
+        self._smdl_token += 1
+        self._smdl_started_token = self._smdl_token
         self.bg_player.stop()
 
     def play_sadl(self, path):
-        sadl = load_sadl(path)
-        self.sadl_player.load_sound(sadl)
-        self.sadl_player.play()
+        self._sadl_token += 1
+        try:
+            data = read_sadl(path)
+        except Exception as e:
+            logging.error(f"Error reading SADL {path}: {e}")
+            return
+        threading.Thread(target=self._load_sadl, args=(self._sadl_token, path, data), daemon=True).start()
 
     def stop_sadl(self):
+        self._sadl_token += 1
         self.sadl_player.stop()
 
+    def _start_loaded(self):
+        while self._smdl_loaded:
+            token, (smd_obj, swd_file, sample_bank), vol = self._smdl_loaded.popleft()
+            if token == self._smdl_token:
+                self._smdl_started_token = token
+                self.bg_player.create_temporal_sf2(swd_file, sample_bank)
+                self.bg_player.load_sound(smd_obj)
+                self.bg_player.play()
+                self.bg_player.set_volume(vol)
+                # Fades requested while the sound was loading
+                for is_fade_in, frames in self._smdl_fades:
+                    self.fade(is_fade_in, frames)
+        while self._sadl_loaded:
+            token, sadl = self._sadl_loaded.popleft()
+            if token == self._sadl_token:
+                self.sadl_player.load_sound(sadl)
+                self.sadl_player.play()
+
     def update_(self, dt: float):
-        self.sadl_player.update(dt)
-        self.bg_player.update(dt)
+        self._start_loaded()
+        if self.sadl_player.is_active:
+            self.sadl_player.update(dt)
+        if self.bg_player.is_active:
+            self.bg_player.update(dt)
 
     def fade(self, is_fade_in, frames):
+        if self._smdl_started_token != self._smdl_token:
+            self._smdl_fades.append((is_fade_in, frames))
+            return
         time = frames / 1000.0
         self.bg_player.fade(time, is_fade_in)
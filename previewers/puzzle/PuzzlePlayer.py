@@ -1,3 +1,5 @@
+from typing import Dict, Callable
+
 from pg_utils.rom.RomSingleton import RomSingleton
 import formats.puzzle as pzd
 from pg_utils.TwoScreenRenderer import TwoScreenRenderer
@@ -14,6 +16,13 @@ from .PuzzleWinScreen import PuzzleWinScreen
 class PuzzlePlayer(TwoScreenRenderer):
     MUSIC_ACTIVE = False
 
+    TOP_BG_TEMPLATE = "data_lt2/bg/nazo/system/nazo_text{}.arc"
+    # Bottom background path, indexed by whether the background depends on the language
+    BTM_BG_TEMPLATES = ("data_lt2/bg/nazo/q{}.arc", "data_lt2/bg/nazo/?/q{}.arc")
+    # Hint button tags, indexed by the number of hints used
+    HINT_TAGS_OFF = ("0_off", "1_off", "2_off", "3_off")
+    HINT_TAGS_ON = ("0_on", "1_on", "2_on", "3_on")
+
     def __init__(self, puzzle_data: pzd.Puzzle):
         super(PuzzlePlayer, self).__init__()
 
@@ -29,15 +38,12 @@ class PuzzlePlayer(TwoScreenRenderer):
         self.font_loader: k4pg.FontLoader = RomSingleton().get_font_loader()
 
         self.top_bg = k4pg.Sprite()
-        self.sprite_loader.load(f"data_lt2/bg/nazo/system/nazo_text{puzzle_data.bg_location_id}.arc", self.top_bg,
+        self.sprite_loader.load(self.TOP_BG_TEMPLATE.format(puzzle_data.bg_location_id), self.top_bg,
                                 sprite_sheet=False)
 
         self.btm_bg = k4pg.Sprite()
-        if not puzzle_data.bg_lang:
-            self.sprite_loader.load(f"data_lt2/bg/nazo/q{puzzle_data.bg_btm_id}", self.btm_bg)
-        else:
-            self.sprite_loader.load(f"data_lt2/bg/nazo/?/q{puzzle_data.bg_btm_id}.arc", self.btm_bg,
-                                    sprite_sheet=False)
+        self.sprite_loader.load(self.BTM_BG_TEMPLATES[bool(puzzle_data.bg_lang)].format(puzzle_data.bg_btm_id),
+                                self.btm_bg, sprite_sheet=False)
 
         self.top_text = k4pg.Text(position=pg.Vector2(-256//2 + 8, -192 // 2 + 23),
                                   center=pg.Vector2(k4pg.Alignment.LEFT, k4pg.Alignment.TOP),
@@ -46,19 +52,16 @@ class PuzzlePlayer(TwoScreenRenderer):
         self.font_loader.load("fontq", 10, self.top_text)
 
         self.header_top_left = []
-        for i in range(4):
+        digits = f"{puzzle_data.number % 1000:03d}"
+        for i, tag in enumerate(["nazo", *digits]):
             header_item = k4pg.Sprite(center=pg.Vector2(k4pg.Alignment.TOP, k4pg.Alignment.LEFT))
+            # The sprite loader caches the decoded archive, so only the first load decodes it.
             self.sprite_loader.load(f"data_lt2/ani/nazo/system/?/nazo_text.arc", header_item)
+            header_item.set_tag(tag)
             if i == 0:
-                header_item.set_tag("nazo")
                 header_item.position.update(-256 // 2 + 5, -192 // 2 + 4)
             else:
-                i -= 1
-                p_num = puzzle_data.number
-                for a in range(2 - i):
-                    p_num //= 10
-                header_item.set_tag(str(p_num % 10))
-                header_item.position.update(-256 // 2 + 23 + i * 7, -192 // 2 + 5)
+                header_item.position.update(-256 // 2 + 23 + (i - 1) * 7, -192 // 2 + 5)
             self.header_top_left.append(header_item)
 
         btn_off = "off"
@@ -66,8 +69,9 @@ class PuzzlePlayer(TwoScreenRenderer):
 
         current_y = -192 // 2
         self.hints_btn = k4pg.ButtonSprite(center=pg.Vector2(k4pg.Alignment.RIGHT, k4pg.Alignment.TOP),
-                                           position=pg.Vector2(256 // 2, current_y), not_pressed_tag="0_off",
-                                           pressed_tag="0_on")
+                                           position=pg.Vector2(256 // 2, current_y),
+                                           not_pressed_tag=self.HINT_TAGS_OFF[0],
+                                           pressed_tag=self.HINT_TAGS_ON[0])
         self.sprite_loader.load("data_lt2/ani/system/btn/?/hint.arc", self.hints_btn)
 
         current_y += self.hints_btn.get_world_rect().h
@@ -93,6 +97,9 @@ class PuzzlePlayer(TwoScreenRenderer):
                                             pressed_tag=btn_on)
         self.sprite_loader.load("data_lt2/ani/system/btn/?/hantei.arc", self.submit_btn)
 
+        # Buttons animated while the puzzle or the win screen are shown
+        self.animated_buttons = [self.hints_btn, self.quit_btn, self.memo_btn, self.submit_btn]
+
         self.hints = PuzzleHints(self.puzzle_data, self.sprite_loader, self.font_loader)
         self.on_hints = False
 
@@ -117,12 +124,16 @@ class PuzzlePlayer(TwoScreenRenderer):
         self.music_toggle.color_key = pg.Color(0, 255, 0)
         self.music_toggle.set_tag("OFF" if PuzzlePlayer.MUSIC_ACTIVE else "ON")
 
-    def run_gds_cmd(self, cmd):
-        pass
+    def get_gds_handlers(self) -> Dict[int, Callable]:
+        # Functions running each GDS command used by the puzzle type, called with the command parameters
+        return {}
 
     def run_gds(self):
+        handlers = self.get_gds_handlers()
         for cmd in self.puzzle_data.gds.commands:
-            self.run_gds_cmd(cmd)
+            handler = handlers.get(cmd.command)
+            if handler is not None:
+                handler(*cmd.params)
 
     def update_submitted(self, dt):
         if self.submit_btn.get_pressed(self.btm_camera, dt):
@@ -141,23 +152,24 @@ class PuzzlePlayer(TwoScreenRenderer):
         if self.on_hints:
             self.on_hints = self.hints.update(dt)
             if not self.on_hints:
-                self.hints_btn.not_pressed_tag = f"{self.hints.used}_off"
-                self.hints_btn.pressed_tag = f"{self.hints.used}_on"
+                self.hints_btn.not_pressed_tag = self.HINT_TAGS_OFF[self.hints.used]
+                self.hints_btn.pressed_tag = self.HINT_TAGS_ON[self.hints.used]
         elif self.on_win:
-            self.hints_btn.animate(dt)
-            self.quit_btn.animate(dt)
-            self.memo_btn.animate(dt)
-            self.submit_btn.animate(dt)
+            self.animate_buttons(dt)
             self.on_win = self.win_screen.update(dt)
         else:
             self.update_base(dt)
 
+    def animate_buttons(self, dt: float):
+        # Most button tags are a single frame, so once the buttons settle there is nothing to animate.
+        for button in self.animated_buttons:
+            if button.is_animating:
+                button.animate(dt)
+
     def update_base(self, dt: float):
-        self.hints_btn.animate(dt)
-        self.quit_btn.animate(dt)
-        self.memo_btn.animate(dt)
-        self.submit_btn.animate(dt)
-        self.reset_btn.animate(dt)
+        self.animate_buttons(dt)
+        if self.reset_btn.is_animating:
+            self.reset_btn.animate(dt)
 
         if self.music_toggle.get_pressed(self.btm_camera, dt):
             PuzzlePlayer.MUSIC_ACTIVE = not PuzzlePlayer.MUSIC_ACTIVE
@@ -2,7 +2,6 @@ from typing import List, Union
 
 from ..PuzzlePlayer import PuzzlePlayer
 from formats.puzzle import Puzzle
-from formats.gds import GDSCommand
 from formats import conf
 import k4pg
 import pygame as pg
@@ -35,37 +34,42 @@ class Area(PuzzlePlayer):
         self.tiles: List[List[Union[AreaTile, None]]] = []
         super(Area, self).__init__(puzzle_data)
 
-    def run_gds_cmd(self, cmd: GDSCommand):
-        if cmd.command == 0x4a:
-            x, y, tiles_w, tiles_h, tile_size_w, tile_size_h, r, g, b, a = cmd.params
-            board_pos = pg.Vector2(x, y) - pg.Vector2(256 // 2, 192 // 2)
-            tile_size = pg.Vector2(tile_size_w, tile_size_h)
-
-            tile_color = pg.Color(r << 3, g << 3, b << 3)
-            tile_surf = pg.Surface(tile_size)
-            tile_surf.fill(tile_color)
-
-            for tile_x in range(tiles_w):
-                tile_column = []
-                for tile_y in range(tiles_h):
-                    pos = pg.Vector2(tile_x, tile_y)
-                    pos *= tile_size.elementwise()
-                    pos += board_pos
-                    tile = AreaTile(position=pos)
-                    tile.surf = tile_surf
-                    tile.alpha = a << 3
-                    tile_column.append(tile)
-                self.tiles.append(tile_column)
-        elif cmd.command == 0x6e:
-            x, y, w, h = cmd.params
-            for x_ in range(x, x + w):
-                for y_ in range(y, y + h):
-                    self.tiles[x_][y_] = None
-        elif cmd.command == 0x4b:
-            x, y, w, h = cmd.params
-            for x_ in range(x, x + w):
-                for y_ in range(y, y + h):
-                    self.tiles[x_][y_].solution_set = True
+    def get_gds_handlers(self):
+        return {
+            0x4a: self.gds_add_tiles,
+            0x6e: self.gds_remove_tiles,
+            0x4b: self.gds_set_solution,
+        }
+
+    def gds_add_tiles(self, x, y, tiles_w, tiles_h, tile_size_w, tile_size_h, r, g, b, a):
+        board_pos = pg.Vector2(x, y) - pg.Vector2(256 // 2, 192 // 2)
+        tile_size = pg.Vector2(tile_size_w, tile_size_h)
+
+        tile_color = pg.Color(r << 3, g << 3, b << 3)
+        tile_surf = pg.Surface(tile_size)
+        tile_surf.fill(tile_color)
+
+        for tile_x in range(tiles_w):
+            tile_column = []
+            for tile_y in range(tiles_h):
+                pos = pg.Vector2(tile_x, tile_y)
+                pos *= tile_size.elementwise()
+                pos += board_pos
+                tile = AreaTile(position=pos)
+                tile.surf = tile_surf
+                tile.alpha = a << 3
+                tile_column.append(tile)
+            self.tiles.append(tile_column)
+
+    def gds_remove_tiles(self, x, y, w, h):
+        for x_ in range(x, x + w):
+            for y_ in range(y, y + h):
+                self.tiles[x_][y_] = None
+
+    def gds_set_solution(self, x, y, w, h):
+        for x_ in range(x, x + w):
+            for y_ in range(y, y + h):
+                self.tiles[x_][y_].solution_set = True
 
     def update_submitted(self, dt):
         for tile_col in self.tiles:
@@ -2,7 +2,6 @@ from typing import Optional
 
 from ..PuzzlePlayer import PuzzlePlayer
 from formats.puzzle import Puzzle
-from formats.gds import GDSCommand
 import k4pg
 import pygame as pg
 from formats import conf
@@ -31,12 +30,15 @@ class MultipleChoice(PuzzlePlayer):
         self.submit_btn.visible = False
         self.reset_btn.visible = False
 
-    def run_gds_cmd(self, cmd: GDSCommand):
-        if cmd.command == 0x14:  # add_button
-            x, y, path, is_solution, _ = cmd.params
-            btn = MultipleChoiceButton(is_solution == 1, position=pg.Vector2(-256//2 + x, -192//2 + y))
-            self.sprite_loader.load(f"data_lt2/ani/nazo/freebutton/{path}", btn)
-            self.buttons.append(btn)
+    def get_gds_handlers(self):
+        return {
+            0x14: self.gds_add_button,
+        }
+
+    def gds_add_button(self, x, y, path, is_solution, _):
+        btn = MultipleChoiceButton(is_solution == 1, position=pg.Vector2(-256//2 + x, -192//2 + y))
+        self.sprite_loader.load(f"data_lt2/ani/nazo/freebutton/{path}", btn)
+        self.buttons.append(btn)
 
     def update_submitted(self, dt):
         for button in self.buttons:
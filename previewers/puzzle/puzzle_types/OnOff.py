@@ -1,4 +1,3 @@
-from formats.gds import GDSCommand
 from ..PuzzlePlayer import PuzzlePlayer
 from formats.puzzle import Puzzle
 import k4pg
@@ -38,12 +37,15 @@ class OnOff(PuzzlePlayer):
         super(OnOff, self).__init__(puzzle_data)
         self.reset_btn.visible = False
         
-    def run_gds_cmd(self, cmd: GDSCommand):
-        if cmd.command == 0x14:
-            x, y, path, solution_set, _ = cmd.params
-            option = OnOffToggle(solution_set == 1, position=pg.Vector2(-256//2 + x, -192//2 + y))
-            self.sprite_loader.load(f"data_lt2/ani/nazo/onoff/{path}", option)
-            self.options.append(option)
+    def get_gds_handlers(self):
+        return {
+            0x14: self.gds_add_option,
+        }
+
+    def gds_add_option(self, x, y, path, solution_set, _):
+        option = OnOffToggle(solution_set == 1, position=pg.Vector2(-256//2 + x, -192//2 + y))
+        self.sprite_loader.load(f"data_lt2/ani/nazo/onoff/{path}", option)
+        self.options.append(option)
 
     def check_solution(self):
         for option in self.options:
@@ -1,6 +1,5 @@
 from typing import List
 
-from formats.gds import GDSCommand
 from formats import conf
 from ..PuzzlePlayer import PuzzlePlayer
 from formats.puzzle import Puzzle
@@ -184,27 +183,30 @@ class Slide(PuzzlePlayer):
             move_counter.set_tag(str(move_count_copy % 10))
             move_count_copy //= 10
 
-    def run_gds_cmd(self, cmd: GDSCommand):
-        if cmd.command == 0x4e:  # Setup
-            pos_x, pos_y, tiles_x, tiles_y, tile_size_x, tile_size_y = cmd.params
-            self.board.setup(pos_x, pos_y, tiles_x, tiles_y, tile_size_x, tile_size_y)
-        elif cmd.command == 0x4f:  # Add Occlusion
-            tile_x, tile_y, tile_w, tile_h = cmd.params
-            self.board.add_occlusion(tile_x, tile_y, tile_w, tile_h)
-        elif cmd.command == 0x50:  # Set Solution
-            tile_idx, sol_x, sol_y = cmd.params
-            self.solutions[tile_idx] = (sol_x, sol_y)
-        elif cmd.command == 0x51:  # Set Tilemap
-            self.tilemap = f"data_lt2/ani/nazo/slide/{cmd.params[0]}"
-        elif cmd.command == 0x52:  # Add Tile
-            _unk, anim, _anim2, tile_x, tile_y = cmd.params
-            tile = SlideTile(self.board, pg.Vector2(tile_x, tile_y))
-            self.sprite_loader.load(self.tilemap, tile)
-            tile.set_tag(anim)
-            self.board.add_tile(tile)
-        elif cmd.command == 0x53:  # Add Tile Collider
-            tile_x, tile_y, tile_w, tile_h = cmd.params
-            self.board.tile_add_collider(pg.Rect(tile_x, tile_y, tile_w, tile_h))
+    def get_gds_handlers(self):
+        return {
+            0x4e: self.board.setup,
+            0x4f: self.board.add_occlusion,
+            0x50: self.gds_set_solution,
+            0x51: self.gds_set_tilemap,
+            0x52: self.gds_add_tile,
+            0x53: self.gds_add_tile_collider,
+        }
+
+    def gds_set_solution(self, tile_idx, sol_x, sol_y):
+        self.solutions[tile_idx] = (sol_x, sol_y)
+
+    def gds_set_tilemap(self, path, *_):
+        self.tilemap = f"data_lt2/ani/nazo/slide/{path}"
+
+    def gds_add_tile(self, _unk, anim, _anim2, tile_x, tile_y):
+        tile = SlideTile(self.board, pg.Vector2(tile_x, tile_y))
+        self.sprite_loader.load(self.tilemap, tile)
+        tile.set_tag(anim)
+        self.board.add_tile(tile)
+
+    def gds_add_tile_collider(self, tile_x, tile_y, tile_w, tile_h):
+        self.board.tile_add_collider(pg.Rect(tile_x, tile_y, tile_w, tile_h))
 
     def update_submitted(self, dt):
         if self.interacting_tile is None:
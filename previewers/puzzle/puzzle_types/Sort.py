@@ -1,6 +1,5 @@
 from ..PuzzlePlayer import PuzzlePlayer
 from formats.puzzle import Puzzle
-from formats.gds import GDSCommand
 from formats import conf
 import k4pg
 import pygame as pg
@@ -41,12 +40,15 @@ class Sort(PuzzlePlayer):
         self.tiles = []
         super(Sort, self).__init__(puzzle_data)
 
-    def run_gds_cmd(self, cmd: GDSCommand):
-        if cmd.command == 0x2e:
-            x, y, path, initial, solution = cmd.params
-            tile = SortTile(str(initial), solution, position=pg.Vector2(-256//2 + x, -192//2 + y))
-            self.sprite_loader.load(f"data_lt2/ani/nazo/touch/{path}", tile)
-            self.tiles.append(tile)
+    def get_gds_handlers(self):
+        return {
+            0x2e: self.gds_add_tile,
+        }
+
+    def gds_add_tile(self, x, y, path, initial, solution):
+        tile = SortTile(str(initial), solution, position=pg.Vector2(-256//2 + x, -192//2 + y))
+        self.sprite_loader.load(f"data_lt2/ani/nazo/touch/{path}", tile)
+        self.tiles.append(tile)
 
     def update_submitted(self, dt):
         for tile in self.tiles:
@@ -1,6 +1,5 @@
 from ..PuzzlePlayer import PuzzlePlayer
 from formats.puzzle import Puzzle, PuzzleType
-from formats.gds import GDSCommand
 import k4pg
 import pygame as pg
 import string
@@ -57,13 +56,21 @@ class Write(PuzzlePlayer):
         self.font_loader.load("font18", 12, self.input_text)
         self.input_text.visible = False
 
-    def run_gds_cmd(self, cmd: GDSCommand):
-        if cmd.command == 0x43:
-            self.sprite_loader.load(f"data_lt2/bg/nazo/drawinput/{cmd.params[0]}", self.write_bg)
-        elif cmd.command == 0x42:
-            self.answer = cmd.params[1]
-        elif cmd.command == 0x41:
-            unk1, unk2, unk3, self.input_len = cmd.params
+    def get_gds_handlers(self):
+        return {
+            0x43: self.gds_set_write_bg,
+            0x42: self.gds_set_answer,
+            0x41: self.gds_set_input_length,
+        }
+
+    def gds_set_write_bg(self, path, *_):
+        self.sprite_loader.load(f"data_lt2/bg/nazo/drawinput/{path}", self.write_bg)
+
+    def gds_set_answer(self, unk1, answer, *_):
+        self.answer = answer
+
+    def gds_set_input_length(self, unk1, unk2, unk3, input_len):
+        self.input_len = input_len
 
     def enter_writing(self):
         self.writing_answer = True
@@ -0,0 +1,84 @@
+import random
+import struct
+import unittest
+import unittest.mock
+
+import ndspy.lz10
+
+from formats.compression import lz10
+
+
+class TestLZ10(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        rng = random.Random(10)
+        cls.samples = [
+            b"",
+            b"a",
+            b"abcabcabcabcabcabcabcabc" * 50,
+            bytes(rng.randrange(4) for _ in range(5000)),  # Many short and overlapping copies
+            bytes(rng.randrange(256) for _ in range(3000)),  # Mostly literals
+            bytes(1000),  # Long runs of the same byte
+        ]
+
+    def decompressors(self):
+        def decompress_py(data):
+            with unittest.mock.patch.object(lz10, "njit", None):
+                return lz10.decompress(data)
+
+        yield "py", decompress_py
+        if lz10.njit is not None:
+            yield "jit", lz10.decompress
+
+    def test_decompress(self):
+        for sample in self.samples:
+            compressed = ndspy.lz10.compress(sample)
+            expected = ndspy.lz10.decompress(compressed)
+            for name, decompress in self.decompressors():
+                with self.subTest(path=name, size=len(sample)):
+                    assert decompress(compressed) == expected
+
+    def test_decompress_truncated(self):
+        for sample in self.samples[2:]:
+            compressed = ndspy.lz10.compress(sample)
+            for cut in range(4, len(compressed), max(1, len(compressed) // 50)):
+                truncated = compressed[:cut]
+                # The trailing bytes can be padding, so only some cuts lose data
+                try:
+                    expected = ndspy.lz10.decompress(truncated)
+                except (IndexError, struct.error):
+                    expected = None
+                for name, decompress in self.decompressors():
+                    with self.subTest(path=name, size=len(sample), cut=cut):
+                        if expected is None:
+                            with self.assertRaises(ValueError):
+                                decompress(truncated)
+                        else:
+                            assert decompress(truncated) == expected
+
+    def test_decompress_corrupt(self):
+        # A copy from before the start of the output
+        data = bytes([0x10, 4, 0, 0, 0x80, 0x00, 0x00])
+        for name, decompress in self.decompressors():
+            with self.subTest(path=name):
+                with self.assertRaisesRegex(ValueError, "offset 0x5"):
+                    decompress(data)
+
+    def test_paths_agree_on_truncated(self):
+        if lz10.njit is None:
+            self.skipTest("numba is not installed")
+        for sample in self.samples[2:]:
+            compressed = ndspy.lz10.compress(sample)
+            for cut in range(4, len(compressed)):
+                truncated = compressed[:cut]
+                results = []
+                for _, decompress in self.decompressors():
+                    try:
+                        results.append(decompress(truncated))
+                    except ValueError as e:
+                        results.append(str(e))
+                assert results[0] == results[1], cut
+
+    def test_compress_round_trip(self):
+        for sample in self.samples:
+            assert lz10.decompress(lz10.compress(sample)) == sample
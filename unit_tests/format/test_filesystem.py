@@ -0,0 +1,207 @@
+import io
+import struct
+import unittest
+
+from formats.filesystem import NintendoDSRom, PlzArchive
+
+
+class TestPlzArchive(unittest.TestCase):
+    FILES = [
+        ("ascii.bin", b"ascii data"),
+        ("シフトJIS.txt", "シフトJIS".encode("shift-jis")),
+        ("empty.bin", b""),
+        ("dup.bin", b"first"),
+        ("aligned.bin", b"1234"),
+        ("dup.bin", b"second"),
+    ]
+
+    @staticmethod
+    def empty_archive():
+        return PlzArchive(file=io.BytesIO(struct.pack("<II4sI", 16, 16, b"PCK2", 0)), compressed=0)
+
+    def build_archive(self):
+        archive = self.empty_archive()
+        for filename, data in self.FILES:
+            archive.add_file(filename)
+            archive.files[-1] = data
+        return archive
+
+    @staticmethod
+    def round_trip(archive):
+        stream = io.BytesIO()
+        archive.write_stream(stream)
+        return PlzArchive(file=io.BytesIO(stream.getvalue()), compressed=0)
+
+    def test_round_trip(self):
+        archive = self.round_trip(self.build_archive())
+        assert archive.filenames == [filename for filename, _ in self.FILES]
+        assert [bytes(file) for file in archive.files] == [data for _, data in self.FILES]
+
+        # A second round trip writes the same archive
+        first, second = io.BytesIO(), io.BytesIO()
+        archive.write_stream(first)
+        self.round_trip(archive).write_stream(second)
+        assert first.getvalue() == second.getvalue()
+
+    def test_open_names(self):
+        archive = self.round_trip(self.build_archive())
+        with archive.open("シフトJIS.txt") as file:
+            assert file.read() == "シフトJIS".encode("shift-jis")
+        with archive.open("empty.bin") as file:
+            assert file.read() == b""
+        with self.assertRaises(FileNotFoundError):
+            archive.open("missing.bin")
+
+    def test_write_opened_file(self):
+        archive = self.empty_archive()
+        with archive.open("new.bin", "wb+") as file:
+            file.write(b"new data")
+        archive = self.round_trip(archive)
+        assert archive.filenames == ["new.bin"]
+        assert bytes(archive.files[0]) == b"new data"
+
+
+class TestPlzArchiveNames(unittest.TestCase):
+    @staticmethod
+    def build_archive():
+        return TestPlzArchive.round_trip(TestPlzArchive().build_archive())
+
+    def test_open_duplicate(self):
+        # Duplicate names open the first file with that name
+        with self.build_archive().open("dup.bin") as file:
+            assert file.read() == b"first"
+
+    def test_add_file_id(self):
+        archive = self.build_archive()
+        assert archive.add_file("dup.bin") == len(TestPlzArchive.FILES)
+        assert archive._name_to_id["dup.bin"] == 3
+        assert archive.add_file("new.bin") == len(TestPlzArchive.FILES) + 1
+        assert archive._name_to_id["new.bin"] == len(TestPlzArchive.FILES) + 1
+
+    def test_remove_duplicate(self):
+        archive = self.build_archive()
+        archive.remove_file("dup.bin")
+        assert archive.filenames == ["ascii.bin", "シフトJIS.txt", "empty.bin", "aligned.bin", "dup.bin"]
+        with archive.open("dup.bin") as file:
+            assert file.read() == b"second"
+        with archive.open("aligned.bin") as file:
+            assert file.read() == b"1234"
+
+    def test_rename_duplicate(self):
+        archive = self.build_archive()
+        archive.rename_file("dup.bin", "renamed.bin")
+        with archive.open("renamed.bin") as file:
+            assert file.read() == b"first"
+        with archive.open("dup.bin") as file:
+            assert file.read() == b"second"
+
+    def test_archives_do_not_share_names(self):
+        archive = PlzArchive(compressed=0)
+        archive.add_file("new.bin")
+        other = PlzArchive(compressed=0)
+        assert other.filenames == []
+        assert other._name_to_id == {}
+
+
+class TestRomFiles(unittest.TestCase):
+    FOLDERS = ["a", "a/sub", "b", "c", "d", "d/sub"]
+    FILES = ["a/1.bin", "a/2.bin", "a/sub/1.bin", "b/1.bin", "d/sub/1.bin"]
+    NEW_FILES = ["c/new.bin", "a/new.bin", "a/sub/new.bin", "c/new2.bin", "d/new.bin", "d/sub/new.bin"]
+
+    def build_rom(self, batch_size=None):
+        rom = NintendoDSRom()
+        if batch_size is not None:
+            rom.INSERT_BATCH_SIZE = batch_size
+        # Files can't be added to or removed from the root folder by path
+        rom.files.append(b"root.bin")
+        rom.filenames.files.append("root.bin")
+        for folder in self.FOLDERS:
+            rom.add_folder(folder)
+        for path in self.FILES:
+            with rom.open(path, "wb+") as file:
+                file.write(path.encode())
+        return rom
+
+    @staticmethod
+    def contents(rom):
+        """Returns the path and data of every file, and the first id and files of every folder."""
+        files = [(rom.filenames.filenameOf(i), rom.files[i]) for i in range(len(rom.files))]
+        folders = []
+        stack = [("", rom.filenames)]
+        while stack:
+            path, folder = stack.pop()
+            folders.append((path, folder.firstID, list(folder.files)))
+            for name, sub_folder in folder.folders:
+                stack.append((f"{path}{name}/", sub_folder))
+        return files, sorted(folders)
+
+    def first_ids(self, rom):
+        return {path: first_id for path, first_id, _ in self.contents(rom)[1]}
+
+    @staticmethod
+    def check_ids(rom):
+        for i in range(len(rom.files)):
+            assert rom.filenames.idOf(rom.filenames.filenameOf(i)) == i
+
+    def test_add_files(self):
+        # Both adding the files one by one and rebuilding the file list
+        for batch_size in (None, 0):
+            with self.subTest(batch_size=batch_size):
+                expected = self.build_rom()
+                for path in self.NEW_FILES:
+                    expected.add_file(path)
+
+                rom = self.build_rom(batch_size)
+                file_ids = rom.add_files(self.NEW_FILES)
+                assert self.contents(rom) == self.contents(expected)
+                self.check_ids(rom)
+                assert file_ids == [expected.filenames.idOf(path) for path in self.NEW_FILES]
+
+    def test_add_files_first_ids(self):
+        rom = self.build_rom()
+        assert rom.add_files(["c/new.bin", "a/new.bin"]) == [7, 3]
+        assert self.first_ids(rom) == {"": 0, "a/": 1, "a/sub/": 4, "b/": 5, "c/": 7, "d/": 8, "d/sub/": 6}
+
+    def test_add_files_opened(self):
+        for batch_size in (None, 0):
+            with self.subTest(batch_size=batch_size):
+                rom = self.build_rom(batch_size)
+                file = rom.open("d/sub/1.bin", "wb")
+                rom.add_files(self.NEW_FILES)
+                file.write(b"written")
+                file.close()
+                with rom.open("d/sub/1.bin") as file:
+                    assert file.read() == b"written"
+                for path in self.NEW_FILES:
+                    with rom.open(path) as file:
+                        assert file.read() == b""
+
+    def test_remove_files(self):
+        removed = ["a/2.bin", "d/sub/1.bin", "a/sub/1.bin"]
+        # Both deleting the files one by one and rebuilding the file list
+        for batch_size in (None, 0):
+            with self.subTest(batch_size=batch_size):
+                expected = self.build_rom()
+                for path in removed:
+                    expected.remove_file(path)
+
+                rom = self.build_rom(batch_size)
+                file = rom.open("b/1.bin", "wb")
+                rom.remove_files(removed)
+                assert self.contents(rom) == self.contents(expected)
+                self.check_ids(rom)
+                for path in removed:
+                    assert rom.filenames.idOf(path) is None
+                for path in set(self.FILES) - set(removed):
+                    with rom.open(path) as remaining:
+                        assert remaining.read() == path.encode()
+
+                file.write(b"written")
+                file.close()
+                with rom.open("b/1.bin") as file:
+                    assert file.read() == b"written"
+
+    def test_remove_files_first_ids(self):
+        rom = self.build_rom()
+        rom.remove_files(["a/1.bin", "a/2.bin", "b/1.bin"])
+        assert self.first_ids(rom) == {"": 0, "a/": 1, "a/sub/": 1, "b/": 2, "c/": 3, "d/": 3, "d/sub/": 2}